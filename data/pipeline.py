@@ -4,19 +4,45 @@ and social data from Twitter/Telegram
 """
 
 import asyncio
-import aiohttp
+import httpx
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import json
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from contextlib import contextmanager
+import orjson
+import re
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional at runtime
+    def njit(*args, **kwargs):
+        """Without numba, kernels run as plain Python over numpy arrays"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Shared HTTP client: keeps connections (and TLS sessions) alive across
+# fetchers and tokens instead of handshaking per request
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    timeout=30.0
+)
+
+
+async def close_client():
+    """Close the shared HTTP client (call once on shutdown)"""
+    await _CLIENT.aclose()
+
 
 @dataclass
 class TokenData:
@@ -32,6 +58,48 @@ class TokenData:
     market_cap: Optional[float] = None
 
 
+# Candle prices are held as float32: half the memory and bandwidth into the
+# feature kernel. float32 keeps only ~7 significant decimal digits (relative
+# error ~6e-8), which is enough for returns and ratios within one series but
+# not for sums or volume*price products, so the kernel widens every value to
+# float64 before accumulating. Volume spans too many orders of magnitude for
+# float32 and stays float64
+OHLCV_DTYPE = np.float32
+VOLUME_DTYPE = np.float64
+
+# open, high, low, close, volume
+_OHLCV_COLUMN_DTYPES = (OHLCV_DTYPE,) * 4 + (VOLUME_DTYPE,)
+
+
+class Ohlcv(NamedTuple):
+    """Candles as parallel numpy arrays (one per column)"""
+    timestamp: np.ndarray  # datetime64[s], UTC
+    open: np.ndarray       # OHLCV_DTYPE
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray     # VOLUME_DTYPE
+    
+    @classmethod
+    def allocate(cls, size: int) -> "Ohlcv":
+        """Preallocate uninitialised columns for `size` candles"""
+        return cls(
+            np.empty(size, dtype="datetime64[s]"),
+            *(np.empty(size, dtype=dtype) for dtype in _OHLCV_COLUMN_DTYPES)
+        )
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "Ohlcv":
+        """Build from a DataFrame with timestamp/open/high/low/close/volume"""
+        return cls(
+            pd.to_datetime(df["timestamp"]).to_numpy("datetime64[s]"),
+            *(df[col].to_numpy(dtype) for col, dtype in zip(cls._fields[1:], _OHLCV_COLUMN_DTYPES))
+        )
+    
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self._asdict())
+
+
 @dataclass
 class SocialData:
     """Container for social media data"""
@@ -43,72 +111,126 @@ class SocialData:
     is_influencer: bool = False
 
 
+@dataclass
+class SocialBatch:
+    """
+    Column-oriented batch of social posts: one array per SocialData field
+    
+    Feature code reduces over whole columns instead of walking a list of
+    objects attribute by attribute.
+    """
+    timestamp: np.ndarray      # datetime64[s], UTC
+    text: np.ndarray           # object
+    source: np.ndarray         # object
+    author: np.ndarray         # object
+    engagement: np.ndarray     # int64
+    is_influencer: np.ndarray  # bool_
+    
+    def __len__(self) -> int:
+        return len(self.engagement)
+    
+    @classmethod
+    def allocate(cls, size: int) -> "SocialBatch":
+        """Preallocate uninitialised columns for `size` posts"""
+        return cls(
+            timestamp=np.empty(size, dtype="datetime64[s]"),
+            text=np.empty(size, dtype=object),
+            source=np.empty(size, dtype=object),
+            author=np.empty(size, dtype=object),
+            engagement=np.empty(size, dtype=np.int64),
+            is_influencer=np.empty(size, dtype=np.bool_)
+        )
+    
+    @classmethod
+    def from_records(cls, records: List[SocialData]) -> "SocialBatch":
+        """Build a batch from SocialData objects"""
+        batch = cls.allocate(len(records))
+        for i, r in enumerate(records):
+            batch.timestamp[i] = r.timestamp
+            batch.text[i] = r.text
+            batch.source[i] = r.source
+            batch.author[i] = r.author
+            batch.engagement[i] = r.engagement
+            batch.is_influencer[i] = r.is_influencer
+        return batch
+    
+    def records(self) -> Iterator[SocialData]:
+        """Iterate the batch as SocialData objects"""
+        for i in range(len(self)):
+            yield SocialData(
+                timestamp=self.timestamp[i].astype(datetime),
+                text=self.text[i],
+                source=self.source[i],
+                author=self.author[i],
+                engagement=int(self.engagement[i]),
+                is_influencer=bool(self.is_influencer[i])
+            )
+
+
 class DexDataFetcher:
     """Fetch on-chain data from DEX aggregators"""
     
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = _CLIENT):
         self.dexscreener_base = "https://api.dexscreener.com/latest/dex"
         self.birdeye_base = "https://public-api.birdeye.so"
-        self.session = None
-    
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
-    
-    async def __aexit__(self, *args):
-        await self.session.close()
+        self.birdeye_headers = {"X-API-KEY": "YOUR_BIRDEYE_KEY"}
+        self.client = client
     
     async def get_token_info(self, token_address: str, chain: str = "solana") -> Dict:
         """Get current token info from DexScreener"""
         url = f"{self.dexscreener_base}/tokens/{token_address}"
-        async with self.session.get(url) as resp:
-            data = await resp.json()
-            if "pairs" in data and len(data["pairs"]) > 0:
-                return data["pairs"][0]
-            return {}
+        resp = await self.client.get(url)
+        data = orjson.loads(resp.content)
+        if "pairs" in data and len(data["pairs"]) > 0:
+            return data["pairs"][0]
+        return {}
     
     async def get_ohlcv(
         self, 
         token_address: str, 
         interval: str = "1h",
         limit: int = 168  # 1 week of hourly data
-    ) -> pd.DataFrame:
+    ) -> Ohlcv:
         """
         Get OHLCV data - using Birdeye API
         Intervals: 1m, 5m, 15m, 30m, 1h, 4h, 1d
         """
         # Birdeye OHLCV endpoint
         url = f"{self.birdeye_base}/defi/ohlcv"
+        now = int(time.time())
         params = {
             "address": token_address,
             "type": interval,
-            "time_from": int((datetime.now() - timedelta(hours=limit)).timestamp()),
-            "time_to": int(datetime.now().timestamp())
+            "time_from": now - limit * 3600,
+            "time_to": now
         }
-        headers = {"X-API-KEY": "YOUR_BIRDEYE_KEY"}
         
-        async with self.session.get(url, params=params, headers=headers) as resp:
-            data = await resp.json()
-            
-        if "data" not in data:
-            return pd.DataFrame()
+        resp = await self.client.get(url, params=params, headers=self.birdeye_headers)
+        data = orjson.loads(resp.content)
         
-        df = pd.DataFrame(data["data"]["items"])
-        df["timestamp"] = pd.to_datetime(df["unixTime"], unit="s")
-        df = df.rename(columns={
-            "o": "open", "h": "high", "l": "low", 
-            "c": "close", "v": "volume"
-        })
-        return df[["timestamp", "open", "high", "low", "close", "volume"]]
+        if "data" not in data:
+            return Ohlcv.allocate(0)
+        
+        # Fill the column arrays straight from the decoded items
+        items = data["data"]["items"]
+        ohlcv = Ohlcv.allocate(len(items))
+        unix_time = ohlcv.timestamp.view(np.int64)
+        for i, item in enumerate(items):
+            unix_time[i] = item["unixTime"]
+            ohlcv.open[i] = item["o"]
+            ohlcv.high[i] = item["h"]
+            ohlcv.low[i] = item["l"]
+            ohlcv.close[i] = item["c"]
+            ohlcv.volume[i] = item["v"]
+        return ohlcv
     
     async def get_holder_data(self, token_address: str) -> Dict:
         """Get holder distribution from Birdeye"""
         url = f"{self.birdeye_base}/defi/token_holder_stat"
         params = {"address": token_address}
-        headers = {"X-API-KEY": "YOUR_BIRDEYE_KEY"}
         
-        async with self.session.get(url, params=params, headers=headers) as resp:
-            data = await resp.json()
+        resp = await self.client.get(url, params=params, headers=self.birdeye_headers)
+        data = orjson.loads(resp.content)
         
         return {
             "total_holders": data.get("data", {}).get("holder", 0),
@@ -124,10 +246,9 @@ class DexDataFetcher:
         """Get recent trades for transaction analysis"""
         url = f"{self.birdeye_base}/defi/txs/token"
         params = {"address": token_address, "limit": limit}
-        headers = {"X-API-KEY": "YOUR_BIRDEYE_KEY"}
         
-        async with self.session.get(url, params=params, headers=headers) as resp:
-            data = await resp.json()
+        resp = await self.client.get(url, params=params, headers=self.birdeye_headers)
+        data = orjson.loads(resp.content)
         
         if "data" not in data:
             return pd.DataFrame()
@@ -136,27 +257,56 @@ class DexDataFetcher:
         return df
 
 
+class TickerMatcher:
+    """
+    Match cashtag mentions against a set of tracked tickers in one pass
+    
+    Every `$SYMBOL` token in a text is pulled out by a single linear regex
+    scan and looked up in a dict, so the cost per text is independent of
+    how many tickers are tracked.
+    """
+    _CASHTAG = re.compile(r"\$([A-Za-z][A-Za-z0-9_]{0,15})\b")
+    
+    def __init__(self, tickers: Optional[Dict[str, str]] = None):
+        # Upper-cased symbol -> token address
+        self._tickers: Dict[str, str] = {}
+        for symbol, token_address in (tickers or {}).items():
+            self.add(symbol, token_address)
+    
+    def __len__(self) -> int:
+        return len(self._tickers)
+    
+    def add(self, symbol: str, token_address: str):
+        self._tickers[symbol.lstrip("$").upper()] = token_address
+    
+    def remove(self, symbol: str):
+        self._tickers.pop(symbol.lstrip("$").upper(), None)
+    
+    def match(self, text: str) -> List[str]:
+        """Token addresses of every tracked ticker mentioned in `text`"""
+        hits = []
+        for symbol in self._CASHTAG.findall(text):
+            token_address = self._tickers.get(symbol.upper())
+            if token_address is not None and token_address not in hits:
+                hits.append(token_address)
+        return hits
+
+
 class SocialDataFetcher:
     """Fetch social media data for sentiment analysis"""
     
-    def __init__(self, twitter_bearer: str):
+    def __init__(self, twitter_bearer: str, client: httpx.AsyncClient = _CLIENT):
         self.twitter_bearer = twitter_bearer
         self.twitter_base = "https://api.twitter.com/2"
-        self.session = None
-    
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
-    
-    async def __aexit__(self, *args):
-        await self.session.close()
+        self.twitter_headers = {"Authorization": f"Bearer {twitter_bearer}"}
+        self.client = client
     
     async def search_tweets(
         self, 
         query: str,
         max_results: int = 100,
         hours_back: int = 24
-    ) -> List[SocialData]:
+    ) -> SocialBatch:
         """Search recent tweets mentioning token"""
         url = f"{self.twitter_base}/tweets/search/recent"
         
@@ -170,43 +320,99 @@ class SocialDataFetcher:
             "user.fields": "public_metrics"
         }
         
-        headers = {"Authorization": f"Bearer {self.twitter_bearer}"}
+        resp = await self.client.get(url, params=params, headers=self.twitter_headers)
+        data = orjson.loads(resp.content)
         
-        async with self.session.get(url, params=params, headers=headers) as resp:
-            data = await resp.json()
+        tweets = data.get("data", [])
+        results = SocialBatch.allocate(len(tweets))
+        results.source[:] = "twitter"
         
-        results = []
-        for tweet in data.get("data", []):
+        for i, tweet in enumerate(tweets):
             metrics = tweet.get("public_metrics", {})
-            engagement = (
+            results.engagement[i] = (
                 metrics.get("like_count", 0) + 
                 metrics.get("retweet_count", 0) * 2 +
                 metrics.get("reply_count", 0)
             )
-            
-            results.append(SocialData(
-                timestamp=datetime.fromisoformat(tweet["created_at"].replace("Z", "")),
-                text=tweet["text"],
-                source="twitter",
-                author=tweet["author_id"],
-                engagement=engagement,
-                is_influencer=engagement > 100  # rough heuristic
-            ))
+            results.timestamp[i] = tweet["created_at"].replace("Z", "")
+            results.text[i] = tweet["text"]
+            results.author[i] = tweet["author_id"]
+        
+        results.is_influencer[:] = results.engagement > 100  # rough heuristic
         
         return results
     
+    async def stream_mentions(
+        self,
+        matcher: TickerMatcher
+    ) -> AsyncIterator[Tuple[str, SocialData]]:
+        """
+        Consume the filtered stream and yield (token_address, post) per match
+        
+        Stream rules are managed separately and should be broad (e.g. a
+        cashtag rule); ticker matching happens locally so one connection
+        covers every tracked launch instead of one search poll per ticker.
+        """
+        url = f"{self.twitter_base}/tweets/search/stream"
+        params = {"tweet.fields": "created_at,public_metrics,author_id"}
+        
+        async with self.client.stream(
+            "GET", url, params=params, headers=self.twitter_headers, timeout=None
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.strip():
+                    continue  # keep-alive
+                tweet = orjson.loads(line).get("data")
+                if not tweet:
+                    continue
+                
+                token_addresses = matcher.match(tweet["text"])
+                if not token_addresses:
+                    continue
+                
+                metrics = tweet.get("public_metrics", {})
+                engagement = (
+                    metrics.get("like_count", 0) + 
+                    metrics.get("retweet_count", 0) * 2 +
+                    metrics.get("reply_count", 0)
+                )
+                post = SocialData(
+                    timestamp=datetime.fromisoformat(tweet["created_at"].replace("Z", "")),
+                    text=tweet["text"],
+                    source="twitter",
+                    author=tweet["author_id"],
+                    engagement=engagement,
+                    is_influencer=engagement > 100
+                )
+                for token_address in token_addresses:
+                    yield token_address, post
+    
     async def get_mention_velocity(
         self, 
         ticker: str, 
-        windows: List[int] = [1, 4, 12, 24]
+        windows: List[int] = [1, 4, 12, 24],
+        tweets: Optional[SocialBatch] = None
     ) -> Dict[str, float]:
-        """Calculate mention counts over different time windows"""
+        """
+        Calculate mention counts over different time windows
+        
+        Every window is a subset of the largest one, so a single search
+        covering max(windows) is bucketed locally by tweet age. Pass
+        `tweets` to reuse a search that already covers that span.
+        """
         velocities = {}
         
+        if tweets is None:
+            tweets = await self.search_tweets(ticker, hours_back=max(windows))
+        
+        now = np.datetime64(datetime.utcnow(), "s")
+        age_s = (now - tweets.timestamp).astype(np.int64)
+        
         for hours in windows:
-            tweets = await self.search_tweets(ticker, hours_back=hours)
-            velocities[f"mentions_{hours}h"] = len(tweets)
-            velocities[f"engagement_{hours}h"] = sum(t.engagement for t in tweets)
+            mask = age_s <= hours * 3600
+            velocities[f"mentions_{hours}h"] = int(mask.sum())
+            velocities[f"engagement_{hours}h"] = int(tweets.engagement[mask].sum())
         
         # Calculate velocity (rate of change)
         if velocities.get("mentions_4h", 0) > 0:
@@ -220,44 +426,111 @@ class SocialDataFetcher:
         return velocities
 
 
+_PRICE_FEATURE_COLUMNS = [
+    "return_1h", "return_4h", "return_12h", "return_24h",
+    "volatility_24h", "volume_ratio", "volume_momentum",
+    "pv_divergence", "trend_strength", "ath_distance",
+]
+
+# fastmath minus nnan/ninf: warm-up rows are NaN and zero volume yields inf,
+# both of which must survive to the fillna(0) in compute_price_features
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy", nogil=True)
+def _price_features(c, v):
+    """
+    Rolling price/volume features over hourly candles in a single O(N) pass
+    
+    Matches the pandas definitions (pct_change, rolling(n).mean/.std with
+    ddof=1) including NaN for rows before a window is full. Rolling sums
+    are kept by adding the incoming value and subtracting the outgoing one.
+    """
+    n = c.shape[0]
+    out = np.full((n, 10), np.nan)
+    
+    running_max = -np.inf
+    sum_c24 = 0.0
+    sumsq_c24 = 0.0
+    sum_c12 = 0.0
+    sum_v24 = 0.0
+    
+    for i in range(n):
+        # Widen float32 prices so sums of squares don't lose precision
+        ci = np.float64(c[i])
+        vi = np.float64(v[i])
+        
+        sum_c24 += ci
+        sumsq_c24 += ci * ci
+        sum_c12 += ci
+        sum_v24 += vi
+        if i >= 24:
+            c_out = np.float64(c[i - 24])
+            sum_c24 -= c_out
+            sumsq_c24 -= c_out * c_out
+            sum_v24 -= v[i - 24]
+        if i >= 12:
+            sum_c12 -= c[i - 12]
+        
+        # ATH distance
+        running_max = max(running_max, ci)
+        out[i, 9] = ci / running_max - 1.0
+        
+        # Returns at different windows
+        if i >= 1:
+            out[i, 0] = ci / c[i - 1] - 1.0
+        if i >= 4:
+            out[i, 1] = ci / c[i - 4] - 1.0
+            # Volume momentum and price-volume divergence (key signal)
+            out[i, 6] = vi / v[i - 4] - 1.0
+            out[i, 7] = out[i, 1] - out[i, 6] * 0.5
+        if i >= 12:
+            out[i, 2] = ci / c[i - 12] - 1.0
+        if i >= 24:
+            out[i, 3] = ci / c[i - 24] - 1.0
+        
+        if i >= 23:
+            mean_c24 = sum_c24 / 24.0
+            var_c24 = max((sumsq_c24 - sum_c24 * mean_c24) / 23.0, 0.0)
+            # Volatility
+            out[i, 4] = np.sqrt(var_c24) / mean_c24
+            # Volume ratio
+            out[i, 5] = vi / (sum_v24 / 24.0)
+            # Trend strength
+            out[i, 8] = (sum_c12 / 12.0) / mean_c24 - 1.0
+    
+    return out
+
+
+def warmup():
+    """
+    Compile (or load from numba's on-disk cache) the feature kernel
+
+    Call once at service startup so the first real token doesn't pay JIT
+    latency; importing the module for DataStorage etc. stays cheap.
+    """
+    _price_features(np.ones(2, OHLCV_DTYPE), np.ones(2, VOLUME_DTYPE))
+
+
 class FeatureEngineer:
     """Transform raw data into ML features"""
     
     @staticmethod
-    def compute_price_features(df: pd.DataFrame) -> pd.DataFrame:
+    def compute_price_features(ohlcv: Ohlcv) -> pd.DataFrame:
         """Compute price-based features from OHLCV"""
-        features = pd.DataFrame(index=df.index)
-        
-        # Returns at different windows
-        for window in [1, 4, 12, 24]:
-            features[f"return_{window}h"] = df["close"].pct_change(window)
-        
-        # Volatility
-        features["volatility_24h"] = df["close"].rolling(24).std() / df["close"].rolling(24).mean()
-        
-        # Volume features
-        features["volume_ratio"] = df["volume"] / df["volume"].rolling(24).mean()
-        features["volume_momentum"] = df["volume"].pct_change(4)
-        
-        # Price-volume divergence (key signal)
-        features["pv_divergence"] = (
-            features["return_4h"] - 
-            features["volume_momentum"] * 0.5
-        )
+        _, open_, high, low, close, volume = ohlcv
         
-        # Trend strength
-        features["trend_strength"] = (
-            df["close"].rolling(12).mean() / 
-            df["close"].rolling(24).mean() - 1
+        # Returns, volatility, volume, divergence, trend and ATH in one pass
+        features = pd.DataFrame(
+            _price_features(close, volume),
+            columns=_PRICE_FEATURE_COLUMNS
         )
         
-        # ATH distance
-        features["ath_distance"] = df["close"] / df["close"].cummax() - 1
-        
         # Candle patterns
-        features["body_ratio"] = (df["close"] - df["open"]) / (df["high"] - df["low"] + 1e-10)
-        features["upper_wick"] = (df["high"] - df[["open", "close"]].max(axis=1)) / (df["high"] - df["low"] + 1e-10)
-        features["lower_wick"] = (df[["open", "close"]].min(axis=1) - df["low"]) / (df["high"] - df["low"] + 1e-10)
+        candle_range = high - low + 1e-10
+        features["body_ratio"] = (close - open_) / candle_range
+        features["upper_wick"] = (high - np.maximum(open_, close)) / candle_range
+        features["lower_wick"] = (np.minimum(open_, close) - low) / candle_range
         
         return features.fillna(0)
     
@@ -279,7 +552,7 @@ class FeatureEngineer:
         return features.fillna(0)
     
     @staticmethod
-    def compute_social_features(social_data: List[SocialData]) -> Dict:
+    def compute_social_features(social_data: SocialBatch) -> Dict:
         """Aggregate social data into features"""
         if not social_data:
             return {
@@ -290,14 +563,12 @@ class FeatureEngineer:
                 "sentiment_score": 0
             }
         
-        df = pd.DataFrame([vars(s) for s in social_data])
-        
         return {
-            "mention_count": len(df),
-            "total_engagement": df["engagement"].sum(),
-            "avg_engagement": df["engagement"].mean(),
-            "influencer_ratio": df["is_influencer"].mean(),
-            "unique_authors": df["author"].nunique()
+            "mention_count": len(social_data),
+            "total_engagement": int(social_data.engagement.sum()),
+            "avg_engagement": float(social_data.engagement.mean()),
+            "influencer_ratio": float(social_data.is_influencer.mean()),
+            "unique_authors": len(set(social_data.author))
         }
     
     @staticmethod
@@ -330,11 +601,21 @@ class DataStorage:
     
     def __init__(self, db_path: str = "data/memecoin.db"):
         self.db_path = db_path
+        self._lock = threading.Lock()
         self._init_db()
     
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # One connection for the lifetime of the storage object so the WAL,
+        # page cache and sqlite3's statement cache survive across calls
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+        
+        cursor = self._conn.cursor()
         
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS price_data (
@@ -346,7 +627,7 @@ class DataStorage:
                 close REAL,
                 volume REAL,
                 PRIMARY KEY (token_address, timestamp)
-            )
+            ) WITHOUT ROWID
         """)
         
         cursor.execute("""
@@ -360,6 +641,10 @@ class DataStorage:
                 engagement INTEGER
             )
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_social_token_time
+            ON social_data(token_address, timestamp DESC)
+        """)
         
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS holder_data (
@@ -369,34 +654,83 @@ class DataStorage:
                 top_10_pct REAL,
                 top_20_pct REAL,
                 PRIMARY KEY (token_address, timestamp)
-            )
+            ) WITHOUT ROWID
         """)
-        
-        conn.commit()
-        conn.close()
     
-    def store_price_data(self, token_address: str, df: pd.DataFrame):
-        conn = sqlite3.connect(self.db_path)
-        df["token_address"] = token_address
-        df.to_sql("price_data", conn, if_exists="append", index=False)
-        conn.close()
+    @contextmanager
+    def _txn(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor inside a single BEGIN/COMMIT on the shared connection"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                yield cursor
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+    
+    def close(self):
+        self._conn.close()
+    
+    def store_price_data(self, token_address: str, ohlcv: Ohlcv):
+        # TEXT timestamps in the same "YYYY-MM-DD HH:MM:SS" layout as before
+        timestamps = np.char.replace(
+            np.datetime_as_string(ohlcv.timestamp, unit="s"), "T", " "
+        )
+        rows = [
+            (token_address, *row)
+            for row in zip(
+                timestamps.tolist(),
+                ohlcv.open.tolist(),
+                ohlcv.high.tolist(),
+                ohlcv.low.tolist(),
+                ohlcv.close.tolist(),
+                ohlcv.volume.tolist()
+            )
+        ]
+        # One explicit transaction for the whole batch: a single commit
+        # (and fsync) instead of one per inserted row
+        with self._txn() as cursor:
+            cursor.executemany(
+                "INSERT OR IGNORE INTO price_data "
+                "(token_address, timestamp, open, high, low, close, volume) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
     
     def load_price_data(
         self, 
         token_address: str, 
         start_time: datetime = None
-    ) -> pd.DataFrame:
-        conn = sqlite3.connect(self.db_path)
-        query = f"SELECT * FROM price_data WHERE token_address = ?"
+    ) -> Ohlcv:
+        query = (
+            "SELECT timestamp, open, high, low, close, volume "
+            "FROM price_data WHERE token_address = ?"
+        )
         params = [token_address]
         
         if start_time:
             query += " AND timestamp >= ?"
-            params.append(start_time.isoformat())
+            params.append(start_time.isoformat(sep=" "))
         
-        df = pd.read_sql(query, conn, params=params)
-        conn.close()
-        return df
+        query += " ORDER BY timestamp"
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        
+        if not rows:
+            return Ohlcv.allocate(0)
+        
+        # Transpose rows into columns and convert each column in one call
+        timestamp, open_, high, low, close, volume = zip(*rows)
+        return Ohlcv(
+            np.array(timestamp, dtype="datetime64[s]"),
+            *(
+                np.array(col, dtype=dtype)
+                for col, dtype in zip((open_, high, low, close, volume), _OHLCV_COLUMN_DTYPES)
+            )
+        )
 
 
 # Main data collection pipeline
@@ -404,23 +738,23 @@ async def collect_token_data(
     token_address: str,
     ticker: str,
     twitter_bearer: str
-) -> Tuple[pd.DataFrame, pd.DataFrame, List[SocialData]]:
+) -> Tuple[pd.DataFrame, pd.DataFrame, SocialBatch, Dict[str, float]]:
     """
     Full data collection pipeline for a single token
-    Returns: (price_features, holder_features, social_data)
+    Returns: (price_features, holder_features, social_data, velocities)
     """
     
-    async with DexDataFetcher() as dex:
-        # Get OHLCV
-        ohlcv = await dex.get_ohlcv(token_address, interval="1h", limit=168)
-        
-        # Get holder data
-        holder_data = await dex.get_holder_data(token_address)
+    dex = DexDataFetcher()
+    social = SocialDataFetcher(twitter_bearer)
     
-    async with SocialDataFetcher(twitter_bearer) as social:
-        # Get tweets
-        tweets = await social.search_tweets(f"${ticker}", hours_back=24)
-        velocities = await social.get_mention_velocity(f"${ticker}")
+    # OHLCV, holder data and tweets are independent
+    ohlcv, holder_data, tweets = await asyncio.gather(
+        dex.get_ohlcv(token_address, interval="1h", limit=168),
+        dex.get_holder_data(token_address),
+        social.search_tweets(f"${ticker}", hours_back=24)
+    )
+    # The 24h search already covers every velocity window
+    velocities = await social.get_mention_velocity(f"${ticker}", tweets=tweets)
     
     # Engineer features
     fe = FeatureEngineer()
@@ -437,13 +771,18 @@ if __name__ == "__main__":
     import asyncio
     
     async def main():
+        warmup()
+
         token = "YOUR_TOKEN_ADDRESS"
         ticker = "TICKER"
         bearer = "YOUR_TWITTER_BEARER"
         
-        price_feat, holder_feat, tweets, velocities = await collect_token_data(
-            token, ticker, bearer
-        )
+        try:
+            price_feat, holder_feat, tweets, velocities = await collect_token_data(
+                token, ticker, bearer
+            )
+        finally:
+            await close_client()
         
         print(f"Price features shape: {price_feat.shape}")
         print(f"Tweets collected: {len(tweets)}")
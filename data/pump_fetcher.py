@@ -5,13 +5,33 @@ Real-time monitoring of pump.fun token launches via API polling.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import base58
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def _address_key(address: Optional[str]) -> bytes:
+    """
+    Compact dedup key for a token address
+
+    Solana addresses are base58 text for a 32-byte public key; keeping the
+    raw bytes is roughly a third of the memory of the str. Anything that
+    isn't valid base58 falls back to its UTF-8 bytes.
+    """
+    if address:
+        try:
+            return base58.b58decode(address)
+        except ValueError:
+            pass
+    return str(address).encode()
+
+
 class LaunchEvent:
     """Represents a token launch event"""
 
@@ -80,7 +100,9 @@ class PumpFunFetcher:
     def __init__(
         self,
         api_base: str = "https://api.pump.fun",
-        polling_interval: int = 10
+        polling_interval: int = 10,
+        seen_tokens_capacity: int = 200_000,
+        on_launches: Optional[Callable[[List["LaunchEvent"]], Awaitable[None]]] = None
     ):
         """
         Initialize PumpFunFetcher
@@ -88,13 +110,20 @@ class PumpFunFetcher:
         Args:
             api_base: Base URL for pump.fun API
             polling_interval: Seconds between polls
+            seen_tokens_capacity: Max token addresses remembered for dedup
+            on_launches: Optional async hook called with each poll's new
+                LaunchEvents before they are returned (e.g. to persist them)
         """
         self.api_base = api_base
         self.polling_interval = polling_interval
+        self.on_launches = on_launches
         self.client = httpx.AsyncClient(timeout=30.0)
 
-        # Cache of seen token addresses to avoid duplicates
-        self.seen_tokens: set = set()
+        # LRU of seen token keys (raw pubkey bytes) to avoid duplicates.
+        # Bounded so a long-running poller doesn't grow without limit;
+        # evicted tokens are long past being "new" anyway.
+        self.seen_tokens: "OrderedDict[bytes, None]" = OrderedDict()
+        self.seen_tokens_capacity = seen_tokens_capacity
 
     async def detect_launches(
         self,
@@ -115,24 +144,31 @@ class PumpFunFetcher:
 
             params = {
                 "limit": 50,
-                "since": int((datetime.utcnow() - timedelta(minutes=lookback_minutes)).timestamp())
+                "since": int(time.time()) - lookback_minutes * 60
             }
 
             response = await self.client.get(url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            # Parse launches
-            launches = []
+            # Parse launches; everything in this poll shares one discovery time
+            discovered_at = datetime.utcnow()
+            events = []
+            new_keys = []
             for token_data in data.get("tokens", []):
                 token_address = token_data.get("address")
+                key = _address_key(token_address)
 
                 # Skip if already seen
-                if token_address in self.seen_tokens:
+                if key in self.seen_tokens:
+                    self.seen_tokens.move_to_end(key)
                     continue
 
-                self.seen_tokens.add(token_address)
+                self.seen_tokens[key] = None
+                new_keys.append(key)
+                if len(self.seen_tokens) > self.seen_tokens_capacity:
+                    self.seen_tokens.popitem(last=False)
 
                 launch = LaunchEvent(
                     token_address=token_address,
@@ -140,7 +176,7 @@ class PumpFunFetcher:
                     mint_address=token_data.get("mint"),
                     creator=token_data.get("creator"),
                     initial_price=float(token_data.get("initialPrice", 0)),
-                    discovered_timestamp=datetime.utcnow(),
+                    discovered_timestamp=discovered_at,
                     bonding_curve_address=token_data.get("bondingCurve"),
                     metadata={
                         "name": token_data.get("name"),
@@ -149,8 +185,18 @@ class PumpFunFetcher:
                     }
                 )
 
-                launches.append(launch.to_dict())
+                events.append(launch)
+
+            if events and self.on_launches:
+                try:
+                    await self.on_launches(events)
+                except Exception as e:
+                    # Forget these tokens so the next poll offers them again
+                    logger.error(f"Launch hook failed for {len(events)} launches: {e}")
+                    for key in new_keys:
+                        self.seen_tokens.pop(key, None)
 
+            launches = [launch.to_dict() for launch in events]
             logger.info(f"Detected {len(launches)} new launches (lookback: {lookback_minutes}m)")
             return launches
 
@@ -181,7 +227,7 @@ class PumpFunFetcher:
             response = await self.client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return BondingCurveState(
                 token_address=token_address,
@@ -215,7 +261,7 @@ class PumpFunFetcher:
             response = await self.client.get(url)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return {
                 "token_address": token_address,
@@ -0,0 +1,62 @@
+"""
+GAMBA rock-paper-scissors round resolution
+"""
+
+import asyncio
+import hashlib
+
+from tokencast.segment_generators.gamba import GambaSegmentGenerator
+
+BETS = [
+    {"user_id": "win", "choice": "PAPER", "bet_amount": 10},
+    {"user_id": "tie", "choice": "ROCK", "bet_amount": 5},
+    {"user_id": "loss", "choice": "SCISSORS", "bet_amount": 7},
+    {"user_id": "invalid", "choice": "LIZARD", "bet_amount": 3},
+    {"user_id": "win2", "choice": "PAPER", "bet_amount": "2.5"},
+]
+
+
+def _resolve(bets, gizmo_choice="ROCK", round_id="rps_4_2"):
+    return asyncio.run(GambaSegmentGenerator().resolve_round(round_id, bets, gizmo_choice))
+
+
+def test_win_tie_loss_and_invalid_payouts():
+    result = _resolve(BETS)
+
+    assert result["winners"] == [
+        {"user_id": "win", "choice": "PAPER", "bet_amount": 10.0, "payout": 20.0},
+        {"user_id": "win2", "choice": "PAPER", "bet_amount": 2.5, "payout": 5.0},
+    ]
+    assert result["total_bets"] == 5
+    # 2x on the wins, stake back on the tie, nothing on the loss or invalid pick
+    assert result["total_payout"] == 20.0 + 5.0 + 5.0
+    assert result["house_profit"] == 27.5 - 30.0
+
+
+def test_every_pairing_against_gizmo():
+    for gizmo, beaten_by, beats in (
+        ("ROCK", "PAPER", "SCISSORS"),
+        ("PAPER", "SCISSORS", "ROCK"),
+        ("SCISSORS", "ROCK", "PAPER"),
+    ):
+        bets = [
+            {"user_id": "w", "choice": beaten_by, "bet_amount": 1},
+            {"user_id": "t", "choice": gizmo, "bet_amount": 1},
+            {"user_id": "l", "choice": beats, "bet_amount": 1},
+        ]
+        result = _resolve(bets, gizmo)
+        assert [w["user_id"] for w in result["winners"]] == ["w"]
+        assert result["total_payout"] == 3.0
+        assert result["house_profit"] == 0.0
+
+
+def test_empty_round():
+    result = _resolve([])
+    assert result["winners"] == []
+    assert result["total_payout"] == 0.0
+    assert result["house_profit"] == 0.0
+
+
+def test_reveal_carries_the_committed_hash():
+    result = _resolve(BETS, "SCISSORS", "rps_4_2")
+    assert result["gizmo_choice_hash"] == hashlib.sha256(b"SCISSORS:4:2").digest()[:8].hex()
@@ -0,0 +1,75 @@
+"""
+Launch persistence via the PumpFunFetcher on_launches hook
+"""
+
+import asyncio
+
+import httpx
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from data.pump_fetcher import PumpFunFetcher
+from tokencast.database.models import Base, PumpFunToken
+
+TOKENS = {"tokens": [
+    {"address": "So11111111111111111111111111111111111111112", "symbol": "AAA", "initialPrice": 0.5},
+    {"symbol": "NOADDR", "initialPrice": 1.0},
+]}
+
+
+def _fetcher(on_launches):
+    fetcher = PumpFunFetcher(api_base="http://pump", on_launches=on_launches)
+    fetcher.client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=orjson.dumps(TOKENS))
+    ))
+    return fetcher
+
+
+def test_launches_persisted_and_rows_without_address_skipped():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def persist(launches):
+            async with sessions.begin() as db:
+                await PumpFunToken.record_launches(db, launches)
+
+        fetcher = _fetcher(persist)
+        try:
+            launches = await fetcher.detect_launches()
+        finally:
+            await fetcher.close()
+        async with sessions() as db:
+            rows = (await db.execute(select(PumpFunToken))).scalars().all()
+        await engine.dispose()
+        return launches, rows
+
+    launches, rows = asyncio.run(run())
+    assert len(launches) == 2
+    assert [(r.token_address, r.ticker, r.price_at_discovery) for r in rows] == [
+        ("So11111111111111111111111111111111111111112", "AAA", 0.5)
+    ]
+
+
+def test_failed_hook_keeps_launches_unseen_for_retry():
+    calls = []
+
+    async def failing(launches):
+        calls.append(len(launches))
+        raise RuntimeError("database unavailable")
+
+    async def run():
+        fetcher = _fetcher(failing)
+        try:
+            first = await fetcher.detect_launches()
+            second = await fetcher.detect_launches()
+        finally:
+            await fetcher.close()
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(first) == len(second) == 2
+    assert calls == [2, 2]
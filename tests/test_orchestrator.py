@@ -0,0 +1,92 @@
+"""
+Orchestrator tests against an in-memory SQLite database
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from tokencast.database.models import Base, PumpFunToken
+from tokencast.models import SegmentOutput, SegmentType, ShowConfig
+from tokencast.orchestrator import TokencastOrchestrator
+from tokencast.scheduler import SegmentScheduler
+from tokencast.segment_generators import SwarmAnalysisGenerator
+from tokencast.segment_generators.base import SegmentGenerator
+
+
+class RecordingSwarm:
+    """SWARM client stub that records analyze_token calls"""
+
+    def __init__(self):
+        self.analyzed = []
+
+    async def analyze_token(self, ticker=None, token_address=None):
+        self.analyzed.append((ticker, token_address))
+        return {"regime": "Trending", "risk_score": 0.2}
+
+
+class LaunchStub(SegmentGenerator):
+    """Features one freshly launched token, like TokenLaunchGenerator"""
+
+    async def generate_content(self, context):
+        return SegmentOutput(
+            speaker_notes="launch",
+            featured_tokens=[{"token_address": "launch-addr", "ticker": "LAUNCH"}]
+        )
+
+
+async def _run_show(rotation, generators, tokens=(), segments=1):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory.begin() as db:
+        db.add_all(PumpFunToken(token_address=address, ticker=ticker) for address, ticker in tokens)
+
+    orchestrator = TokencastOrchestrator(session_factory)
+    for segment_type, generator in generators.items():
+        orchestrator.register_segment_generator(segment_type, generator)
+
+    await orchestrator.start_show(ShowConfig(segment_rotation=rotation, auto_transition=False))
+    for _ in range(segments - 1):
+        await orchestrator.start_next_segment()
+    await orchestrator.end_show()
+    await engine.dispose()
+
+
+def test_featured_token_ticker_resolved_from_database(monkeypatch):
+    swarm = RecordingSwarm()
+    generator = SwarmAnalysisGenerator(swarm)
+
+    # Pin the token on the segment config
+    original = SegmentScheduler._get_config
+
+    def pinned(self, segment_type):
+        return original(self, segment_type).model_copy(update={"featured_token": "db-addr"})
+
+    monkeypatch.setattr(SegmentScheduler, "_get_config", pinned)
+
+    asyncio.run(_run_show(
+        [SegmentType.SWARM_ANALYSIS],
+        {SegmentType.SWARM_ANALYSIS: generator},
+        tokens=[("db-addr", "DBTOKEN")]
+    ))
+
+    assert swarm.analyzed == [("DBTOKEN", "db-addr")]
+
+
+def test_featured_token_carried_over_from_previous_segment():
+    swarm = RecordingSwarm()
+
+    # The scheduler opens a show on the second rotation entry
+    asyncio.run(_run_show(
+        [SegmentType.SWARM_ANALYSIS, SegmentType.TOKEN_LAUNCH_LIVE, SegmentType.SWARM_ANALYSIS],
+        {
+            SegmentType.TOKEN_LAUNCH_LIVE: LaunchStub(),
+            SegmentType.SWARM_ANALYSIS: SwarmAnalysisGenerator(swarm),
+        },
+        segments=2
+    ))
+
+    assert swarm.analyzed == [("LAUNCH", "launch-addr")]
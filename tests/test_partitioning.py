@@ -0,0 +1,76 @@
+"""
+community_interactions partitioning on Postgres
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from tokencast.database.models import Base
+from tokencast.models import ShowConfig
+from tokencast.orchestrator import TokencastOrchestrator
+
+# e.g. postgresql+asyncpg://postgres@localhost/tokencast_test
+POSTGRES_URL = os.getenv("TOKENCAST_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TOKENCAST_TEST_DATABASE_URL not set")
+
+SCHEMA = "tokencast_partition_test"
+
+# community_interactions as created before it was partitioned
+_LEGACY_INTERACTIONS = """
+CREATE TABLE community_interactions (
+    id serial PRIMARY KEY,
+    show_id integer NOT NULL REFERENCES tokencast_shows (id),
+    segment_id integer,
+    user_id varchar(255) NOT NULL,
+    segment_type varchar(32),
+    interaction_type varchar(50) NOT NULL,
+    content text,
+    extra_metadata jsonb,
+    created_at timestamptz NOT NULL DEFAULT now()
+)
+"""
+
+
+async def _start_show_and_interact(legacy_table: bool):
+    engine = create_async_engine(
+        POSTGRES_URL, connect_args={"server_settings": {"search_path": SCHEMA}}
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+            if legacy_table:
+                await conn.execute(text("DROP TABLE community_interactions CASCADE"))
+                await conn.execute(text(_LEGACY_INTERACTIONS))
+
+        orchestrator = TokencastOrchestrator(async_sessionmaker(engine, expire_on_commit=False))
+        state = await orchestrator.start_show(ShowConfig(auto_transition=False))
+        await orchestrator.record_interaction("user", "chat_message", "gm")
+        await orchestrator.end_show()
+
+        async with engine.connect() as conn:
+            return state.show_id, (await conn.execute(text(
+                "SELECT tableoid::regclass::text FROM community_interactions"
+            ))).scalars().all()
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def test_show_gets_its_own_partition():
+    show_id, tables = asyncio.run(_start_show_and_interact(legacy_table=False))
+
+    assert tables == [f"community_interactions_s{show_id}"]
+
+
+def test_unpartitioned_legacy_table_still_starts_shows():
+    _, tables = asyncio.run(_start_show_and_interact(legacy_table=True))
+
+    assert tables == ["community_interactions"]
@@ -0,0 +1,21 @@
+"""
+Feature pipeline precision tests
+"""
+
+import numpy as np
+
+from data.pipeline import OHLCV_DTYPE, VOLUME_DTYPE, _price_features
+
+
+def test_float32_prices_match_float64_features():
+    rng = np.random.default_rng(7)
+    # A week of hourly sub-cent memecoin closes with large, spiky volume
+    close = 2e-6 * np.exp(np.cumsum(rng.normal(0.0, 0.05, 168)))
+    volume = 10 ** rng.uniform(6, 11, 168)
+
+    reference = _price_features(close, volume)
+    stored = _price_features(close.astype(OHLCV_DTYPE), volume.astype(VOLUME_DTYPE))
+
+    # float32 rounds each price by ~6e-8 relative; every feature is a ratio of
+    # (widened) prices or of untouched float64 volumes, so errors stay tiny
+    np.testing.assert_allclose(stored, reference, rtol=0, atol=1e-6, equal_nan=True)
@@ -0,0 +1,45 @@
+"""
+GET /show/{id} loads a show, its segments and their tokens in three queries
+"""
+
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from tokencast.database.models import (
+    Base, SegmentType, SwarmSegmentOutput, TokencastSegment, TokencastShow
+)
+from tokencast.routes.tokencast import get_show
+
+
+def test_get_show_issues_three_selects():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with sessions.begin() as db:
+            show = TokencastShow(show_number=1)
+            segment = TokencastSegment(show=show, segment_type=SegmentType.GAMBA, segment_number=1)
+            segment.swarm_outputs.append(SwarmSegmentOutput(
+                agent_name="PERCEPTRON", analysis_type="regime_detection", output_data={}
+            ))
+            db.add(show)
+
+        selects = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        async with sessions() as db:
+            result = await get_show(show.id, db=db)
+        await engine.dispose()
+        return result, selects
+
+    result, selects = asyncio.run(run())
+    assert result["total_segments"] == 1
+    assert len(selects) == 3
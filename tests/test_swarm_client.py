@@ -0,0 +1,39 @@
+"""
+BatchedSwarmClient tests against a mocked SWARM transport
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tokencast_server import BatchedSwarmClient
+
+
+async def _query_batch(batch_body: bytes):
+    def handler(request):
+        return httpx.Response(200, content=batch_body)
+
+    client = BatchedSwarmClient("http://swarm", "key")
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        return await asyncio.wait_for(
+            asyncio.gather(*(client._query(f"question {i}") for i in range(3))),
+            timeout=2
+        )
+    finally:
+        await client.close()
+
+
+@pytest.mark.parametrize("batch_body", [b'{"error": "overloaded"}', b"not json", b'[{"n": 1}, 2]'])
+def test_malformed_batch_response_resolves_every_caller(batch_body):
+    results = asyncio.run(_query_batch(batch_body))
+
+    assert len(results) == 3
+    assert all(isinstance(result, dict) for result in results)
+
+
+def test_batch_response_is_fanned_out_in_order():
+    results = asyncio.run(_query_batch(b'[{"n": 1}, {"n": 2}, {"n": 3}]'))
+
+    assert results == [{"n": 1}, {"n": 2}, {"n": 3}]
@@ -0,0 +1,45 @@
+"""
+Trending query must stay eligible for the partial idx_tokens_active_recent
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from tokencast.database.models import Base
+from tokencast.routes.pump_fun import _TRENDING_TOKENS
+
+# e.g. postgresql+asyncpg://postgres@localhost/tokencast_test
+POSTGRES_URL = os.getenv("TOKENCAST_TEST_DATABASE_URL")
+
+
+def test_active_status_is_inlined_not_bound():
+    compiled = _TRENDING_TOKENS.compile(dialect=postgresql.asyncpg.dialect())
+
+    assert "tracking_status = 'active'" in str(compiled)
+    assert set(compiled.params) == {"since", "limit"}
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TOKENCAST_TEST_DATABASE_URL not set")
+def test_generic_plan_uses_partial_index():
+    async def explain():
+        engine = create_async_engine(POSTGRES_URL)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                sql = str(_TRENDING_TOKENS.compile(dialect=engine.dialect))
+                await conn.exec_driver_sql(f"PREPARE trending(timestamptz, int) AS {sql}")
+                # A generic plan is what asyncpg's cached statements end up on
+                await conn.exec_driver_sql("SET LOCAL plan_cache_mode = force_generic_plan")
+                await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+                rows = await conn.exec_driver_sql("EXPLAIN EXECUTE trending(now(), 10)")
+                plan = "\n".join(row[0] for row in rows)
+                await conn.exec_driver_sql("DEALLOCATE trending")
+                return plan
+        finally:
+            await engine.dispose()
+
+    assert "idx_tokens_active_recent" in asyncio.run(explain())
@@ -11,7 +11,7 @@ from .models import (
     TokencastMetric,
     CommunityInteraction
 )
-from .db import get_db, init_db
+from .db import AsyncSessionLocal, engine, get_db, init_db
 
 __all__ = [
     "TokencastShow",
@@ -21,6 +21,8 @@ __all__ = [
     "SwarmSegmentOutput",
     "TokencastMetric",
     "CommunityInteraction",
+    "AsyncSessionLocal",
+    "engine",
     "get_db",
     "init_db"
 ]
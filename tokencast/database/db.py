@@ -3,9 +3,9 @@ Database session management for Tokencast
 """
 
 import os
-from typing import Generator
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from .models import Base
 
 # Database URL from environment
@@ -15,42 +15,70 @@ DATABASE_URL = os.getenv(
     "sqlite:///./tokencast.db"
 )
 
+
+def _async_url(url: str) -> str:
+    """Point a plain database URL at its asyncio driver (aiosqlite / asyncpg)"""
+    scheme, sep, rest = url.partition("://")
+    if "+" in scheme:
+        return url
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if scheme in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+
 # Create engine
 # Use appropriate pool settings based on database type
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
+    # An in-memory database exists per connection, so every session has to
+    # share the same one (e.g. for test runs)
+    in_memory = DATABASE_URL == "sqlite://" or ":memory:" in DATABASE_URL
+    engine = create_async_engine(
+        _async_url(DATABASE_URL),
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool if in_memory else None,
         pool_pre_ping=True
     )
 else:
-    engine = create_engine(
-        DATABASE_URL,
+    # Burst headroom above the steady-state pool instead of failing with
+    # "QueuePool limit reached"; waiters give up after 5s and connections
+    # are recycled before server/proxy idle timeouts close them.
+    # executemany INSERTs are batched into multi-row VALUES pages. The
+    # compiled statement cache is sized above the default 500 so hot queries
+    # never get evicted and recompiled; asyncpg also keeps a per-connection
+    # cache of server-side prepared statements
+    engine = create_async_engine(
+        _async_url(DATABASE_URL),
+        query_cache_size=1024,
+        insertmanyvalues_page_size=10_000,
         pool_size=20,
-        max_overflow=0,
+        max_overflow=40,
+        pool_timeout=5,
+        pool_recycle=1800,
         pool_pre_ping=True
     )
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay readable after commit instead of expiring, since a lazy
+# refresh would need IO outside an await
+AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 
-def init_db():
+async def init_db():
     """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get database session for dependency injection
 
     Usage:
         @app.get("/endpoint")
-        async def endpoint(db: Session = Depends(get_db)):
+        async def endpoint(db: AsyncSession = Depends(get_db)):
             # use db session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
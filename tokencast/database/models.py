@@ -2,18 +2,59 @@
 SQLAlchemy ORM Models for Tokencast System
 """
 
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy import (
     Column, Integer, String, DateTime, Boolean, Float,
-    ForeignKey, Enum, JSON, Text, Index
+    ForeignKey, Enum, JSON, Text, Index, CheckConstraint, PrimaryKeyConstraint,
+    DDL, event, func, text
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import declarative_base, relationship
 import enum
 
 Base = declarative_base()
 
+# Cap on TokencastSegment.content_generated; full text lives in speaker_notes
+CONTENT_GENERATED_MAX_LENGTH = 5000
+
+# JSONB on Postgres (indexable, binary storage), plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _jsonb_gin_index(name: str, column: str) -> Index:
+    """
+    GIN index for @> containment on a JSONB column, Postgres only
+
+    jsonb_path_ops only supports containment but is much smaller and cheaper
+    to maintain than the default jsonb_ops. It does not help -> / ->>
+    equality lookups; those need btree expression indexes.
+    """
+    return Index(
+        name, column,
+        postgresql_using='gin',
+        postgresql_ops={column: 'jsonb_path_ops'}
+    ).ddl_if(dialect='postgresql')
+
+
+def _varchar_enum(enum_cls: type, name: str) -> Enum:
+    """
+    Store a Python enum as VARCHAR + CHECK rather than a native ENUM type
+
+    Adding a member is then a constraint change instead of ALTER TYPE.
+    Values (not member names) are stored; SQLAlchemy still coerces to and
+    from the enum at the boundary.
+    """
+    return Enum(
+        enum_cls,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        values_callable=lambda members: [m.value for m in members],
+        length=32
+    )
+
 
 class ShowStatus(str, enum.Enum):
     """Show status states"""
@@ -33,6 +74,7 @@ class SegmentType(str, enum.Enum):
     COMMUNITY_INTERACTION = "COMMUNITY_INTERACTION"
     AI_HOST_BREAKDOWN = "AI_HOST_BREAKDOWN"
     NARRATIVE_ALPHA = "NARRATIVE_ALPHA"
+    INTERMISSION = "INTERMISSION"
 
 
 class SegmentStatus(str, enum.Enum):
@@ -58,15 +100,21 @@ class TokencastShow(Base):
     show_number = Column(Integer, unique=True, nullable=False)
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
-    status = Column(Enum(ShowStatus), default=ShowStatus.SCHEDULED, nullable=False)
+    status = Column(_varchar_enum(ShowStatus, 'ck_shows_status'), default=ShowStatus.SCHEDULED, nullable=False)
     estimated_duration = Column(Integer, nullable=True)  # in minutes
     total_viewers = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
-    segments = relationship("TokencastSegment", back_populates="show", cascade="all, delete-orphan")
-    metrics = relationship("TokencastMetric", back_populates="show", cascade="all, delete-orphan")
+    # Segments and metrics are only wanted on detail reads, which ask for
+    # them with selectinload(); implicit lazy loads raise instead of
+    # quietly issuing one SELECT per show
+    segments = relationship(
+        "TokencastSegment", back_populates="show", cascade="all, delete-orphan",
+        lazy="raise", order_by="TokencastSegment.segment_number"
+    )
+    metrics = relationship("TokencastMetric", back_populates="show", cascade="all, delete-orphan", lazy="raise")
     interactions = relationship("CommunityInteraction", back_populates="show", cascade="all, delete-orphan")
 
     __table_args__ = (
@@ -81,34 +129,41 @@ class TokencastSegment(Base):
 
     id = Column(Integer, primary_key=True)
     show_id = Column(Integer, ForeignKey('tokencast_shows.id'), nullable=False)
-    segment_type = Column(Enum(SegmentType), nullable=False)
+    segment_type = Column(_varchar_enum(SegmentType, 'ck_segments_type'), nullable=False)
     segment_number = Column(Integer, nullable=False)  # Position in rotation
     started_at = Column(DateTime, nullable=True)
     ended_at = Column(DateTime, nullable=True)
     duration_seconds = Column(Integer, nullable=True)
-    status = Column(Enum(SegmentStatus), default=SegmentStatus.PENDING, nullable=False)
+    status = Column(_varchar_enum(SegmentStatus, 'ck_segments_status'), default=SegmentStatus.PENDING, nullable=False)
 
     # Content
     content_generated = Column(Text, nullable=True)
     speaker_notes = Column(Text, nullable=True)
-    swarm_analysis_data = Column(JSON, nullable=True)
+    swarm_analysis_data = Column(JSONType, nullable=True)
 
     # Metrics
     viewer_count = Column(Integer, default=0)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     show = relationship("TokencastShow", back_populates="segments")
-    featured_tokens = relationship("SegmentToken", back_populates="segment", cascade="all, delete-orphan")
-    swarm_outputs = relationship("SwarmSegmentOutput", back_populates="segment", cascade="all, delete-orphan")
+    # Loaded for a whole batch of segments with one IN query each
+    featured_tokens = relationship("SegmentToken", back_populates="segment", cascade="all, delete-orphan", lazy="selectin")
+    swarm_outputs = relationship("SwarmSegmentOutput", back_populates="segment", cascade="all, delete-orphan", lazy="selectin")
     interactions = relationship("CommunityInteraction", back_populates="segment", cascade="all, delete-orphan")
 
     __table_args__ = (
         Index('idx_segments_show', 'show_id'),
         Index('idx_segments_status', 'status'),
         Index('idx_segments_type', 'segment_type'),
+        _jsonb_gin_index('idx_segments_swarm_data_gin', 'swarm_analysis_data'),
+        # Keep the in-row summary narrow so segment scans stay cheap
+        CheckConstraint(
+            f"length(content_generated) <= {CONTENT_GENERATED_MAX_LENGTH}",
+            name='ck_segments_content_length'
+        ),
     )
 
 
@@ -122,7 +177,7 @@ class PumpFunToken(Base):
     mint_address = Column(String(255), nullable=True)
 
     # Discovery
-    discovered_at = Column(DateTime, default=datetime.utcnow)
+    discovered_at = Column(DateTime(timezone=True), server_default=func.now())
     price_at_discovery = Column(Float, nullable=True)
 
     # Current state
@@ -130,25 +185,93 @@ class PumpFunToken(Base):
     market_cap = Column(Float, nullable=True)
     holders_count = Column(Integer, nullable=True)
     volume_24h = Column(Float, nullable=True)
+    volume_velocity = Column(Float, nullable=True)  # Change in volume_24h per hour, set on refresh
 
     # Metadata
-    social_links = Column(JSON, nullable=True)  # {twitter, discord, website}
+    social_links = Column(JSONType, nullable=True)  # {twitter, discord, website}
     bonding_curve_address = Column(String(255), nullable=True)
 
     # Tracking
     last_tracked_at = Column(DateTime, nullable=True)
-    tracking_status = Column(Enum(TrackingStatus), default=TrackingStatus.ACTIVE, nullable=False)
+    tracking_status = Column(_varchar_enum(TrackingStatus, 'ck_tokens_tracking_status'), default=TrackingStatus.ACTIVE, nullable=False)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     segment_features = relationship("SegmentToken", back_populates="token")
 
+    # Columns kept from the first sighting when a token is upserted again
+    _UPSERT_PRESERVE = ("id", "token_address", "discovered_at", "price_at_discovery", "created_at")
+
+    @classmethod
+    async def bulk_upsert(cls, session: AsyncSession, rows: List[Dict[str, Any]]):
+        """
+        Insert or update many tokens keyed on token_address in one executemany
+
+        The driver pages the rows into multi-row INSERT ... ON CONFLICT DO
+        UPDATE statements instead of a round trip and commit per token.
+        Does not commit.
+
+        Args:
+            session: Database session
+            rows: Column dicts; every row must have the same keys
+        """
+        if not rows:
+            return
+
+        dialect = session.bind.dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+        stmt = insert(cls)
+        update_cols = {
+            key: stmt.excluded[key]
+            for key in rows[0]
+            if key not in cls._UPSERT_PRESERVE
+        }
+        update_cols["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["token_address"],
+            set_=update_cols
+        )
+        await session.execute(stmt, rows)
+
+    @classmethod
+    async def record_launches(cls, session: AsyncSession, launches: List[Any]):
+        """
+        Upsert freshly detected launches (data.pump_fetcher.LaunchEvent)
+
+        Launches without a token_address are skipped rather than failing the
+        whole batch on the NOT NULL key. Does not commit.
+        """
+        await cls.bulk_upsert(session, [
+            {
+                "token_address": launch.token_address,
+                "ticker": launch.ticker,
+                "mint_address": launch.mint_address,
+                "price_at_discovery": launch.initial_price,
+                "discovered_at": launch.discovered_timestamp,
+                "bonding_curve_address": launch.bonding_curve_address
+            }
+            for launch in launches
+            if launch.token_address
+        ])
+
     __table_args__ = (
         Index('idx_tokens_address', 'token_address'),
-        Index('idx_tokens_discovered', 'discovered_at'),
-        Index('idx_tokens_status', 'tracking_status'),
+        # Serves the trending query (active, discovered_at >= ? ORDER BY
+        # volume_velocity) and, with INCLUDE on Postgres, answers it index-only.
+        # Partial on the active subset: graduated/rugged tokens never appear
+        # there, so they add no index size or insert cost
+        Index(
+            'idx_tokens_active_recent', 'discovered_at', 'volume_velocity',
+            postgresql_where=text("tracking_status = 'active'"),
+            sqlite_where=text("tracking_status = 'active'"),
+            postgresql_include=[
+                'token_address', 'ticker', 'volume_24h', 'market_cap', 'holders_count', 'current_price'
+            ]
+        ),
+        _jsonb_gin_index('idx_tokens_social_links_gin', 'social_links'),
     )
 
 
@@ -160,8 +283,8 @@ class SegmentToken(Base):
     segment_id = Column(Integer, ForeignKey('tokencast_segments.id'), nullable=False)
     token_id = Column(Integer, ForeignKey('pump_fun_tokens.id'), nullable=False)
     featured_position = Column(Integer, nullable=False)  # Display order
-    analysis_data = Column(JSON, nullable=True)  # SWARM analysis for this token
-    created_at = Column(DateTime, default=datetime.utcnow)
+    analysis_data = Column(JSONType, nullable=True)  # SWARM analysis for this token
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     segment = relationship("TokencastSegment", back_populates="featured_tokens")
@@ -181,10 +304,10 @@ class SwarmSegmentOutput(Base):
     segment_id = Column(Integer, ForeignKey('tokencast_segments.id'), nullable=False)
     agent_name = Column(String(50), nullable=False)  # PERCEPTRON, FOOLIO, AZOKA, etc.
     analysis_type = Column(String(100), nullable=False)  # regime_detection, narrative_phase, etc.
-    output_data = Column(JSON, nullable=False)
+    output_data = Column(JSONType, nullable=False)
     confidence_score = Column(Float, nullable=True)
     reasoning = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     segment = relationship("TokencastSegment", back_populates="swarm_outputs")
@@ -192,34 +315,94 @@ class SwarmSegmentOutput(Base):
     __table_args__ = (
         Index('idx_swarm_outputs_segment', 'segment_id'),
         Index('idx_swarm_outputs_agent', 'agent_name'),
+        _jsonb_gin_index('idx_swarm_outputs_data_gin', 'output_data'),
     )
 
 
 class CommunityInteraction(Base):
-    """Community interactions during show"""
+    """
+    Community interactions during show
+
+    On Postgres the table is range-partitioned by show_id with one partition
+    per show (see create_show_partition), so the current show's inserts and
+    lookups only touch a small child table and its indexes. A partitioned
+    table's unique keys must include show_id, so there the key is a unique
+    (id, show_id) index instead of PRIMARY KEY (id).
+    """
     __tablename__ = "community_interactions"
 
     id = Column(Integer, primary_key=True)
     show_id = Column(Integer, ForeignKey('tokencast_shows.id'), nullable=False)
     segment_id = Column(Integer, ForeignKey('tokencast_segments.id'), nullable=True)
     user_id = Column(String(255), nullable=False)  # Telegram user ID
+    # Copied from the segment at insert time so per-segment-type
+    # aggregates don't need to join tokencast_segments
+    segment_type = Column(_varchar_enum(SegmentType, 'ck_interactions_segment_type'), nullable=True)
 
     interaction_type = Column(String(50), nullable=False)  # poll_vote, chat_message, token_mention, reaction
     content = Column(Text, nullable=True)
-    extra_metadata = Column(JSON, nullable=True)
+    extra_metadata = Column(JSONType, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     show = relationship("TokencastShow", back_populates="interactions")
     segment = relationship("TokencastSegment", back_populates="interactions")
 
     __table_args__ = (
-        Index('idx_interactions_show', 'show_id'),
+        Index('idx_interactions_show_type_time', 'show_id', 'segment_type', 'created_at'),
+        Index('idx_interactions_segment_type', 'segment_type'),
         Index('idx_interactions_segment', 'segment_id'),
         Index('idx_interactions_type', 'interaction_type'),
+        _jsonb_gin_index('idx_interactions_metadata_gin', 'extra_metadata'),
+        PrimaryKeyConstraint('id').ddl_if(
+            callable_=lambda ddl, target, bind, dialect=None, **kw: dialect.name != 'postgresql'
+        ),
+        Index('uq_interactions_id_show', 'id', 'show_id', unique=True).ddl_if(dialect='postgresql'),
+        {'postgresql_partition_by': 'RANGE (show_id)'},
     )
 
+    @classmethod
+    async def create_show_partition(cls, session: AsyncSession, show_id: int):
+        """
+        Create the partition holding one show's interactions (Postgres only)
+
+        Skipped when the table is not partitioned, i.e. a database created
+        before partitioning and not yet converted (see the upgrade notes in
+        TOKENCAST_DEPLOYMENT.md); interactions then go to the plain table.
+
+        Args:
+            session: Database session, inside the show's creating transaction
+            show_id: Show the partition is for
+        """
+        if session.bind.dialect.name != "postgresql":
+            return
+
+        partitioned = (await session.execute(
+            text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": cls.__tablename__}
+        )).scalar()
+        if not partitioned:
+            return
+
+        show_id = int(show_id)
+        await session.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {cls.__tablename__}_s{show_id} "
+            f"PARTITION OF {cls.__tablename__} "
+            f"FOR VALUES FROM ({show_id}) TO ({show_id + 1})"
+        ))
+
+
+# Catches rows for shows without their own partition
+event.listen(
+    CommunityInteraction.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS community_interactions_default "
+        "PARTITION OF community_interactions DEFAULT"
+    ).execute_if(dialect="postgresql")
+)
+
 
 class TokencastMetric(Base):
     """Metrics and analytics for shows"""
@@ -227,15 +410,18 @@ class TokencastMetric(Base):
 
     id = Column(Integer, primary_key=True)
     show_id = Column(Integer, ForeignKey('tokencast_shows.id'), nullable=False)
+    segment_type = Column(_varchar_enum(SegmentType, 'ck_metrics_segment_type'), nullable=True)  # Denormalized, see CommunityInteraction
     metric_name = Column(String(100), nullable=False)
     metric_value = Column(Float, nullable=False)
-    extra_metadata = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    extra_metadata = Column(JSONType, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     show = relationship("TokencastShow", back_populates="metrics")
 
     __table_args__ = (
-        Index('idx_metrics_show', 'show_id'),
+        Index('idx_metrics_show_type_time', 'show_id', 'segment_type', 'created_at'),
+        Index('idx_metrics_segment_type', 'segment_type'),
         Index('idx_metrics_name', 'metric_name'),
+        _jsonb_gin_index('idx_metrics_metadata_gin', 'extra_metadata'),
     )
@@ -4,7 +4,7 @@ Pydantic schemas for Tokencast API requests/responses
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -27,8 +27,7 @@ class ShowResponse(BaseModel):
     total_viewers: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -67,8 +66,7 @@ class SegmentResponse(BaseModel):
     viewer_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -98,8 +96,7 @@ class TokenStatusResponse(BaseModel):
     bonding_curve_address: Optional[str]
     last_tracked_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TokenAnalyzeRequest(BaseModel):
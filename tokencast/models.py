@@ -8,7 +8,7 @@ For database models, see tokencast/database/models.py
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SegmentType(str, Enum):
@@ -26,7 +26,9 @@ class SegmentType(str, Enum):
 
 
 class SegmentConfig(BaseModel):
-    """Configuration for a segment"""
+    """Configuration for a segment (immutable, so instances can be shared)"""
+    model_config = ConfigDict(frozen=True)
+
     segment_type: SegmentType
     duration_seconds: int = Field(300, description="Default 5 minutes")
     featured_token: Optional[str] = None  # Token address if applicable
@@ -41,6 +43,7 @@ class SegmentContext(BaseModel):
     segment_duration: int  # seconds
     previous_segment_data: Optional[Dict[str, Any]] = None
     featured_tokens: List[str] = Field(default_factory=list)  # Token addresses
+    featured_tickers: List[str] = Field(default_factory=list)  # Tickers, aligned with featured_tokens
     community_feedback: Dict[str, Any] = Field(default_factory=dict)
 
 
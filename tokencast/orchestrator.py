@@ -4,19 +4,25 @@ Tokencast Orchestrator
 Main engine for running live cryptocurrency shows with 9 rotating segments.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from .models import ShowConfig, ShowState, SegmentContext, SegmentOutput, SegmentType
 from .scheduler import SegmentScheduler
 from .database.models import (
-    TokencastShow, TokencastSegment, ShowStatus, SegmentStatus
+    TokencastShow, TokencastSegment, CommunityInteraction, TokencastMetric,
+    PumpFunToken, ShowStatus, SegmentStatus, CONTENT_GENERATED_MAX_LENGTH
 )
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent Telegram sends per broadcast
+BROADCAST_CONCURRENCY = 20
+
 
 class TokencastOrchestrator:
     """
@@ -31,7 +37,7 @@ class TokencastOrchestrator:
 
     def __init__(
         self,
-        db_session: Session,
+        session_factory: async_sessionmaker,
         swarm_client: Optional[Any] = None,
         telegram_bot: Optional[Any] = None,
         pump_fun_client: Optional[Any] = None
@@ -40,21 +46,34 @@ class TokencastOrchestrator:
         Initialize orchestrator
 
         Args:
-            db_session: SQLAlchemy database session
+            session_factory: Async session factory; each operation opens its
+                own short-lived session and transaction
             swarm_client: SWARM API client (optional)
             telegram_bot: Telegram bot instance (optional)
             pump_fun_client: Pump.fun API client (optional)
         """
-        self.db = db_session
+        self.session_factory = session_factory
         self.swarm = swarm_client
         self.telegram = telegram_bot
         self.pump_fun = pump_fun_client
 
         # Runtime state
         self.current_show: Optional[ShowState] = None
+        self.current_segment_type: Optional[SegmentType] = None
+        self.current_segment_started_at: Optional[datetime] = None
         self.scheduler: Optional[SegmentScheduler] = None
         self.segment_generators: Dict[SegmentType, Any] = {}
 
+        # Last /current response body, keyed on what can change it
+        self._current_payload: Optional[Tuple[tuple, Dict[str, Any]]] = None
+
+        # token address -> ticker; a token's ticker never changes once known
+        self._tickers: Dict[str, str] = {}
+
+        # Addresses featured by the most recent segment that featured any;
+        # handed to the next segments as their featured_tokens
+        self._featured_tokens: List[str] = []
+
     async def start_show(self, config: Optional[ShowConfig] = None) -> ShowState:
         """
         Start a new tokencast show
@@ -72,36 +91,39 @@ class TokencastOrchestrator:
         if config is None:
             config = ShowConfig()
 
-        # Get next show number
-        last_show = self.db.query(TokencastShow).order_by(
-            TokencastShow.show_number.desc()
-        ).first()
-        next_show_number = (last_show.show_number + 1) if last_show else 1
-
-        # Create show record
-        show = TokencastShow(
-            show_number=next_show_number,
-            started_at=datetime.utcnow(),
-            status=ShowStatus.LIVE,
-            estimated_duration=config.estimated_duration_minutes
-        )
-        self.db.add(show)
-        self.db.commit()
-        self.db.refresh(show)
+        started_at = datetime.utcnow()
+        async with self.session_factory.begin() as db:
+            # Get next show number (index-only MAX over the unique show_number)
+            next_show_number = (await db.execute(
+                select(func.coalesce(func.max(TokencastShow.show_number), 0) + 1)
+            )).scalar_one()
+
+            # Create show record; RETURNING hands back the PK in the same round trip
+            show_id = (await db.execute(
+                insert(TokencastShow).values(
+                    show_number=next_show_number,
+                    started_at=started_at,
+                    status=ShowStatus.LIVE,
+                    estimated_duration=config.estimated_duration_minutes
+                ).returning(TokencastShow.id)
+            )).scalar_one()
+
+            await CommunityInteraction.create_show_partition(db, show_id)
 
         # Initialize scheduler
         self.scheduler = SegmentScheduler(config)
+        self._featured_tokens = []
 
         # Create show state
         self.current_show = ShowState(
-            show_id=show.id,
-            show_number=show.show_number,
+            show_id=show_id,
+            show_number=next_show_number,
             current_segment_id=None,
-            started_at=show.started_at,
+            started_at=started_at,
             status="live"
         )
 
-        logger.info(f"Started show #{show.show_number} (ID: {show.id})")
+        logger.info(f"Started show #{next_show_number} (ID: {show_id})")
 
         # Start first segment
         await self.start_next_segment()
@@ -124,37 +146,41 @@ class TokencastOrchestrator:
         if not self.current_show or not self.scheduler:
             raise RuntimeError("No show is currently running")
 
-        # End current segment if exists
-        if self.current_show.current_segment_id:
-            await self._end_current_segment()
-
         # Get next segment config
         segment_config = self.scheduler.advance_segment()
-
-        # Create segment record
-        segment = TokencastSegment(
-            show_id=self.current_show.show_id,
-            segment_type=segment_config.segment_type,
-            segment_number=self.current_show.total_segments_completed + 1,
-            started_at=datetime.utcnow(),
-            duration_seconds=segment_config.duration_seconds,
-            status=SegmentStatus.LIVE
-        )
-        self.db.add(segment)
-        self.db.commit()
-        self.db.refresh(segment)
+        segment_number = self.current_show.total_segments_completed + 1
+        started_at = datetime.utcnow()
+
+        async with self.session_factory.begin() as db:
+            # End current segment if exists, in the same transaction as the insert
+            if self.current_show.current_segment_id:
+                await self._end_current_segment(db)
+
+            # Create segment record
+            segment_id = (await db.execute(
+                insert(TokencastSegment).values(
+                    show_id=self.current_show.show_id,
+                    segment_type=segment_config.segment_type,
+                    segment_number=segment_number,
+                    started_at=started_at,
+                    duration_seconds=segment_config.duration_seconds,
+                    status=SegmentStatus.LIVE
+                ).returning(TokencastSegment.id)
+            )).scalar_one()
 
         # Update show state
-        self.current_show.current_segment_id = segment.id
-        self.current_show.total_segments_completed += 1
+        self.current_show.current_segment_id = segment_id
+        self.current_show.total_segments_completed = segment_number
+        self.current_segment_type = segment_config.segment_type
+        self.current_segment_started_at = started_at
 
         logger.info(
-            f"Started segment #{segment.segment_number}: {segment_config.segment_type.value} "
+            f"Started segment #{segment_number}: {segment_config.segment_type.value} "
             f"(duration: {segment_config.duration_seconds}s)"
         )
 
         # Generate segment content (async)
-        await self._generate_segment_content(segment, segment_config)
+        await self._generate_segment_content(segment_id, segment_number, segment_config)
 
         # Schedule automatic transition
         if self.scheduler.show_config.auto_transition:
@@ -163,109 +189,172 @@ class TokencastOrchestrator:
                 callback=self.start_next_segment
             )
 
-    async def _end_current_segment(self):
-        """End the current segment and save metrics"""
+    async def _end_current_segment(self, db: AsyncSession):
+        """
+        Mark the current segment completed
+
+        Issues the UPDATE inside the caller's transaction, which commits it
+        together with the next segment's INSERT (or the show's end).
+        """
         if not self.current_show or not self.current_show.current_segment_id:
             return
 
-        segment = self.db.query(TokencastSegment).filter_by(
-            id=self.current_show.current_segment_id
-        ).first()
+        ended_at = datetime.utcnow()
+        values = {"ended_at": ended_at, "status": SegmentStatus.COMPLETED}
 
-        if segment:
-            segment.ended_at = datetime.utcnow()
-            segment.status = SegmentStatus.COMPLETED
-
-            # Calculate actual duration
-            if segment.started_at:
-                duration = (segment.ended_at - segment.started_at).total_seconds()
-                segment.duration_seconds = int(duration)
+        # Calculate actual duration
+        if self.current_segment_started_at:
+            values["duration_seconds"] = int(
+                (ended_at - self.current_segment_started_at).total_seconds()
+            )
 
-            self.db.commit()
+        await db.execute(
+            update(TokencastSegment)
+            .where(TokencastSegment.id == self.current_show.current_segment_id)
+            .values(**values)
+        )
 
-            logger.info(
-                f"Ended segment #{segment.segment_number}: {segment.segment_type.value} "
-                f"(actual duration: {segment.duration_seconds}s)"
-            )
+        logger.info(
+            f"Ended segment #{self.current_show.total_segments_completed}: "
+            f"{self.current_segment_type.value} "
+            f"(actual duration: {values.get('duration_seconds')}s)"
+        )
 
     async def _generate_segment_content(
         self,
-        segment: TokencastSegment,
+        segment_id: int,
+        segment_number: int,
         config: Any
     ):
         """
         Generate content for segment using appropriate generator
 
         Args:
-            segment: Segment database record
+            segment_id: Segment database ID
+            segment_number: Segment position in the show
             config: Segment configuration
         """
-        # Build context for generator
+        # Build context for generator. A token pinned in the segment config
+        # wins; otherwise carry over what the last segment featured
+        featured_tokens = [config.featured_token] if config.featured_token else self._featured_tokens
         context = SegmentContext(
             show_id=self.current_show.show_id,
-            segment_id=segment.id,
+            segment_id=segment_id,
             segment_type=config.segment_type,
-            segment_duration=config.duration_seconds
+            segment_duration=config.duration_seconds,
+            featured_tokens=featured_tokens
         )
+        if context.featured_tokens:
+            context.featured_tickers = await self._resolve_tickers(context.featured_tokens)
 
         # Get appropriate generator
         generator = self.segment_generators.get(config.segment_type)
 
         if not generator:
             logger.warning(f"No generator for {config.segment_type.value}, using default notes")
-            segment.speaker_notes = f"Segment: {config.segment_type.value}\nDuration: {config.duration_seconds}s"
-            self.db.commit()
+            await self._update_segment(
+                segment_id,
+                speaker_notes=f"Segment: {config.segment_type.value}\nDuration: {config.duration_seconds}s"
+            )
             return
 
         # Generate content
         try:
             output: SegmentOutput = await generator.generate_content(context)
+            self._remember_featured_tokens(output.featured_tokens)
 
             # Save to database
-            segment.speaker_notes = output.speaker_notes
-            segment.content_generated = output.speaker_notes[:5000]  # Truncate if needed
-            segment.swarm_analysis_data = {
-                "swarm_analyses": output.swarm_analyses,
-                "featured_tokens": output.featured_tokens,
-                "metadata": output.metadata
-            }
-
-            self.db.commit()
+            await self._update_segment(
+                segment_id,
+                speaker_notes=output.speaker_notes,
+                content_generated=output.speaker_notes[:CONTENT_GENERATED_MAX_LENGTH],
+                swarm_analysis_data={
+                    "swarm_analyses": output.swarm_analyses,
+                    "featured_tokens": output.featured_tokens,
+                    "metadata": output.metadata
+                }
+            )
 
-            logger.info(f"Generated content for segment #{segment.segment_number}")
+            logger.info(f"Generated content for segment #{segment_number}")
 
         except Exception as e:
             logger.error(f"Error generating segment content: {e}", exc_info=True)
-            segment.speaker_notes = f"Error generating content for {config.segment_type.value}"
-            self.db.commit()
+            await self._update_segment(
+                segment_id,
+                speaker_notes=f"Error generating content for {config.segment_type.value}"
+            )
+
+    def _remember_featured_tokens(self, featured_tokens: List[Dict[str, Any]]):
+        """Keep a segment's featured addresses (and their tickers) for later segments"""
+        addresses = []
+        for token in featured_tokens:
+            address = token.get("token_address")
+            if not address:
+                continue
+            addresses.append(address)
+            ticker = token.get("ticker")
+            if ticker and ticker != "UNKNOWN":
+                self._tickers[address] = ticker
+
+        if addresses:
+            self._featured_tokens = addresses
+
+    async def _resolve_tickers(self, addresses: List[str]) -> List[str]:
+        """
+        Tickers for the given token addresses, in the same order
+
+        Unseen addresses are looked up together in pump_fun_tokens; tokens
+        without a known ticker come back as "UNKNOWN" and are retried later.
+        """
+        missing = [address for address in addresses if address not in self._tickers]
+        if missing:
+            async with self.session_factory.begin() as db:
+                rows = await db.execute(
+                    select(PumpFunToken.token_address, PumpFunToken.ticker)
+                    .where(PumpFunToken.token_address.in_(missing))
+                )
+                self._tickers.update(
+                    (address, ticker) for address, ticker in rows if ticker
+                )
+
+        return [self._tickers.get(address, "UNKNOWN") for address in addresses]
+
+    async def _update_segment(self, segment_id: int, **values):
+        """Write segment columns in one UPDATE without loading the row"""
+        async with self.session_factory.begin() as db:
+            await db.execute(
+                update(TokencastSegment)
+                .where(TokencastSegment.id == segment_id)
+                .values(**values)
+            )
 
     async def end_show(self):
         """End the current show"""
         if not self.current_show:
             raise RuntimeError("No show is currently running")
 
-        # End current segment
-        if self.current_show.current_segment_id:
-            await self._end_current_segment()
-
         # Cancel any scheduled transitions
         if self.scheduler:
             self.scheduler.cancel_scheduled_transition()
 
-        # Update show record
-        show = self.db.query(TokencastShow).filter_by(
-            id=self.current_show.show_id
-        ).first()
+        async with self.session_factory.begin() as db:
+            # End current segment
+            if self.current_show.current_segment_id:
+                await self._end_current_segment(db)
 
-        if show:
-            show.ended_at = datetime.utcnow()
-            show.status = ShowStatus.COMPLETED
-            self.db.commit()
+            # Update show record, in the same transaction as the segment end
+            await db.execute(
+                update(TokencastShow)
+                .where(TokencastShow.id == self.current_show.show_id)
+                .values(ended_at=datetime.utcnow(), status=ShowStatus.COMPLETED)
+            )
 
-            logger.info(f"Ended show #{show.show_number}")
+        logger.info(f"Ended show #{self.current_show.show_number}")
 
         # Clear runtime state
         self.current_show = None
+        self.current_segment_type = None
+        self.current_segment_started_at = None
         self.scheduler = None
 
     async def manual_transition(self):
@@ -281,10 +370,100 @@ class TokencastOrchestrator:
 
         logger.info("Manual transition triggered")
 
+    async def record_interaction(
+        self,
+        user_id: str,
+        interaction_type: str,
+        content: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Record a community interaction against the live show and segment
+
+        Args:
+            user_id: Telegram user ID
+            interaction_type: poll_vote, chat_message, token_mention, reaction
+            content: Message text (optional)
+            extra_metadata: Additional data (optional)
+        """
+        if not self.current_show:
+            raise RuntimeError("No show is currently running")
+
+        async with self.session_factory.begin() as db:
+            await db.execute(
+                insert(CommunityInteraction).values(
+                    show_id=self.current_show.show_id,
+                    segment_id=self.current_show.current_segment_id,
+                    segment_type=self.current_segment_type,
+                    user_id=user_id,
+                    interaction_type=interaction_type,
+                    content=content,
+                    extra_metadata=extra_metadata
+                )
+            )
+
+    async def record_metric(
+        self,
+        metric_name: str,
+        metric_value: float,
+        extra_metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Record a metric against the live show, tagged with the segment type
+
+        Args:
+            metric_name: Metric name
+            metric_value: Metric value
+            extra_metadata: Additional data (optional)
+        """
+        if not self.current_show:
+            raise RuntimeError("No show is currently running")
+
+        async with self.session_factory.begin() as db:
+            await db.execute(
+                insert(TokencastMetric).values(
+                    show_id=self.current_show.show_id,
+                    segment_type=self.current_segment_type,
+                    metric_name=metric_name,
+                    metric_value=metric_value,
+                    extra_metadata=extra_metadata
+                )
+            )
+
     def get_current_state(self) -> Optional[ShowState]:
         """Get current show state"""
         return self.current_show
 
+    def get_current_payload(self) -> Optional[Dict[str, Any]]:
+        """
+        Current show state as served by /current
+
+        Everything but viewer_count only changes on a segment transition, so
+        the body is built once per (show, segment) and reused across polls;
+        viewer_count is filled in fresh on every call.
+        """
+        state = self.current_show
+        if not state:
+            return None
+
+        key = (state.show_id, state.current_segment_id, state.status)
+        if self._current_payload is None or self._current_payload[0] != key:
+            self._current_payload = (key, {
+                "show_id": state.show_id,
+                "show_number": state.show_number,
+                "current_segment_id": state.current_segment_id,
+                "current_segment_index": state.current_segment_index,
+                "started_at": state.started_at,
+                "status": state.status,
+                "total_segments_completed": state.total_segments_completed,
+                "upcoming_segments": [
+                    {"type": seg.segment_type.value, "duration_seconds": seg.duration_seconds}
+                    for seg in self.get_upcoming_segments(3)
+                ]
+            })
+
+        return {**self._current_payload[1], "viewer_count": state.viewer_count}
+
     def get_upcoming_segments(self, count: int = 3) -> list:
         """Get upcoming segments in queue"""
         if not self.scheduler:
@@ -318,14 +497,21 @@ Next segments:
 Get ready for market intelligence, pump.fun launches, and SWARM analysis!
         """
 
-        for group_id in group_ids:
-            try:
-                await self.telegram.send_message(
-                    chat_id=group_id,
-                    text=message.strip()
-                )
-            except Exception as e:
-                logger.error(f"Failed to broadcast to group {group_id}: {e}")
+        # Fan out concurrently, capped to stay inside Telegram's rate limits
+        text = message.strip()
+        semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+        async def _send(group_id):
+            async with semaphore:
+                await self.telegram.send_message(chat_id=group_id, text=text)
+
+        results = await asyncio.gather(
+            *(_send(group_id) for group_id in group_ids),
+            return_exceptions=True
+        )
+        for group_id, result in zip(group_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast to group {group_id}: {result}")
 
     def _format_upcoming_segments(self) -> str:
         """Format upcoming segments for display"""
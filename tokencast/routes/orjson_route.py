@@ -0,0 +1,34 @@
+"""
+orjson request decoding for API routes
+
+FastAPI decodes JSON bodies with the stdlib json module via Request.json().
+ORJSONRoute decodes them with orjson first and stores the result where
+Request.json() looks for it, so body validation sees the same value.
+"""
+
+from typing import Callable, Coroutine, Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+import orjson
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that parses JSON request bodies with orjson"""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            if request.headers.get("content-type", "").startswith("application/json"):
+                body = await request.body()
+                if body:
+                    try:
+                        # Request.json() returns _json when it is already set
+                        request._json = orjson.loads(body)
+                    except orjson.JSONDecodeError:
+                        # Leave it to FastAPI so malformed bodies get its usual 422
+                        pass
+            return await route_handler(request)
+
+        return orjson_route_handler
@@ -5,18 +5,53 @@ Pump.fun Token Launch Routes
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from typing import Optional
 
 from ..database import get_db
 from ..database.models import PumpFunToken, TrackingStatus
 from ..database.schemas import TokenStatusResponse, TokenAnalyzeRequest, TokenAnalyzeResponse
+from ..token_refresher import TokenMetricsRefresher
+from .orjson_route import ORJSONRoute
 from data.pump_fetcher import PumpFunFetcher
 
-router = APIRouter(prefix="/api/pump-fun", tags=["Pump.fun"])
-
-# Global pump.fun client (set by main app)
+router = APIRouter(prefix="/api/pump-fun", tags=["Pump.fun"], route_class=ORJSONRoute)
+
+# Hot read statements are built once with bind parameters, so every call
+# reuses the same compiled SQL from the engine's statement cache. Both only
+# read local columns; on the ORM lookup raiseload('*') turns any relationship
+# access into an error instead of a hidden per-row SELECT
+_TOKEN_BY_ADDRESS = select(PumpFunToken).options(raiseload('*')).where(
+    PumpFunToken.token_address == bindparam("token_address")
+)
+
+# volume_velocity is precomputed by the metrics refresher; tokens without a
+# second sample yet fall back to volume order. Only the response columns are
+# selected: they are all key or INCLUDE columns of idx_tokens_active_recent,
+# so Postgres can answer the query with an index-only scan
+_TRENDING_TOKENS = select(
+    PumpFunToken.token_address,
+    PumpFunToken.ticker,
+    PumpFunToken.volume_24h,
+    PumpFunToken.volume_velocity,
+    PumpFunToken.market_cap,
+    PumpFunToken.holders_count,
+    PumpFunToken.current_price
+).where(
+    PumpFunToken.discovered_at >= bindparam("since"),
+    # Inlined, not bound: under asyncpg's prepared statements a generic plan
+    # can't prove a bound status satisfies the partial index's predicate
+    PumpFunToken.tracking_status == literal_column(f"'{TrackingStatus.ACTIVE.value}'")
+).order_by(
+    PumpFunToken.volume_velocity.desc().nulls_last(),
+    PumpFunToken.volume_24h.desc()
+).limit(bindparam("limit"))
+
+# Global pump.fun client and metrics refresher (set by main app)
 _pump_fun_client: Optional[PumpFunFetcher] = None
+_token_refresher: Optional[TokenMetricsRefresher] = None
 
 
 def set_pump_fun_client(client: PumpFunFetcher):
@@ -32,6 +67,19 @@ def get_pump_fun_client() -> PumpFunFetcher:
     return _pump_fun_client
 
 
+def set_token_refresher(refresher: TokenMetricsRefresher):
+    """Set the global token metrics refresher"""
+    global _token_refresher
+    _token_refresher = refresher
+
+
+def get_token_refresher() -> TokenMetricsRefresher:
+    """Get the token metrics refresher"""
+    if not _token_refresher:
+        raise HTTPException(status_code=503, detail="Token refresher not initialized")
+    return _token_refresher
+
+
 @router.get("/live-launches")
 async def get_live_launches(
     minutes_back: int = 5,
@@ -40,6 +88,9 @@ async def get_live_launches(
     """
     Get recent token launches
 
+    Newly seen launches are persisted by the fetcher's on_launches hook
+    (see tokencast_server), not by this read.
+
     Args:
         minutes_back: How far back to look (default 5 minutes)
 
@@ -62,12 +113,15 @@ async def get_live_launches(
 @router.get("/status/{token_address}", response_model=TokenStatusResponse)
 async def get_token_status(
     token_address: str,
-    db: Session = Depends(get_db),
-    client: PumpFunFetcher = Depends(get_pump_fun_client)
+    db: AsyncSession = Depends(get_db),
+    refresher: TokenMetricsRefresher = Depends(get_token_refresher)
 ):
     """
     Get current status for a token
 
+    Returns the stored metrics immediately; a live refresh is queued and
+    written back in the background (at most once per TTL per token).
+
     Args:
         token_address: Token contract address
 
@@ -75,26 +129,20 @@ async def get_token_status(
         Current token metrics and status
     """
     try:
-        # Check database first
-        token = db.query(PumpFunToken).filter_by(token_address=token_address).first()
+        token = (await db.execute(
+            _TOKEN_BY_ADDRESS, {"token_address": token_address}
+        )).scalar_one_or_none()
 
         if not token:
             raise HTTPException(status_code=404, detail=f"Token {token_address} not found")
 
-        # Get live metrics from pump.fun
-        metrics = await client.get_token_metrics(token_address)
-
-        if metrics:
-            # Update database with fresh data
-            token.current_price = metrics.get("price")
-            token.market_cap = metrics.get("market_cap")
-            token.holders_count = metrics.get("holders")
-            token.volume_24h = metrics.get("volume_24h")
-            db.commit()
-            db.refresh(token)
+        refresher.request(token_address)
 
-        return token
+        # Serialize only the declared response fields, never relationships
+        return TokenStatusResponse.model_validate(token)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get token status: {str(e)}")
 
@@ -102,7 +150,7 @@ async def get_token_status(
 @router.post("/analyze", response_model=TokenAnalyzeResponse)
 async def analyze_token(
     request: TokenAnalyzeRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Analyze a token with SWARM
@@ -132,7 +180,7 @@ async def analyze_token(
 async def get_trending_launches(
     window_minutes: int = 30,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get trending launches by velocity (volume, holders growth)
@@ -149,12 +197,9 @@ async def get_trending_launches(
     # Get recent tokens
     since = datetime.utcnow() - timedelta(minutes=window_minutes)
 
-    tokens = db.query(PumpFunToken).filter(
-        PumpFunToken.discovered_at >= since,
-        PumpFunToken.tracking_status == TrackingStatus.ACTIVE
-    ).order_by(
-        PumpFunToken.volume_24h.desc()
-    ).limit(limit).all()
+    tokens = (await db.execute(
+        _TRENDING_TOKENS, {"since": since, "limit": limit}
+    )).all()
 
     return {
         "trending_tokens": [
@@ -162,6 +207,7 @@ async def get_trending_launches(
                 "token_address": t.token_address,
                 "ticker": t.ticker,
                 "volume_24h": t.volume_24h,
+                "volume_velocity": t.volume_velocity,
                 "market_cap": t.market_cap,
                 "holders": t.holders_count,
                 "price": t.current_price
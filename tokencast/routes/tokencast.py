@@ -5,16 +5,23 @@ Tokencast Show Management Routes
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from typing import Any, Dict, Optional
 
 from ..database import get_db
 from ..database.schemas import ShowCreate, ShowResponse, SegmentResponse
 from ..database.models import TokencastShow, TokencastSegment, ShowStatus
 from ..orchestrator import TokencastOrchestrator
 from ..models import ShowConfig
+from .orjson_route import ORJSONRoute
 
-router = APIRouter(prefix="/api/tokencast", tags=["Tokencast"])
+router = APIRouter(prefix="/api/tokencast", tags=["Tokencast"], route_class=ORJSONRoute)
+
+# Columns of the segment response contract. Selected as plain rows, so no ORM
+# instance (nor its selectin-loaded relationships) is built per request
+_SEGMENT_API_COLS = [getattr(TokencastSegment, name) for name in SegmentResponse.model_fields]
 
 # Global orchestrator instance (set by main app)
 _orchestrator: Optional[TokencastOrchestrator] = None
@@ -34,33 +41,20 @@ def get_orchestrator() -> TokencastOrchestrator:
 
 
 @router.get("/current")
-async def get_current_show(orchestrator: TokencastOrchestrator = Depends(get_orchestrator)):
+async def get_current_show(orchestrator: TokencastOrchestrator = Depends(get_orchestrator)) -> Dict[str, Any]:
     """Get current live show state"""
-    state = orchestrator.get_current_state()
+    payload = orchestrator.get_current_payload()
 
-    if not state:
+    if not payload:
         raise HTTPException(status_code=404, detail="No show currently running")
 
-    return {
-        "show_id": state.show_id,
-        "show_number": state.show_number,
-        "current_segment_id": state.current_segment_id,
-        "current_segment_index": state.current_segment_index,
-        "started_at": state.started_at,
-        "status": state.status,
-        "total_segments_completed": state.total_segments_completed,
-        "viewer_count": state.viewer_count,
-        "upcoming_segments": [
-            {"type": seg.segment_type.value, "duration_seconds": seg.duration_seconds}
-            for seg in orchestrator.get_upcoming_segments(3)
-        ]
-    }
+    return payload
 
 
 @router.post("/start", response_model=ShowResponse)
 async def start_show(
     request: ShowCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     orchestrator: TokencastOrchestrator = Depends(get_orchestrator)
 ):
     """Start a new tokencast show"""
@@ -69,7 +63,7 @@ async def start_show(
         state = await orchestrator.start_show(config)
 
         # Get show from database
-        show = db.query(TokencastShow).filter_by(id=state.show_id).first()
+        show = await db.get(TokencastShow, state.show_id)
 
         if not show:
             raise HTTPException(status_code=500, detail="Show created but not found in database")
@@ -95,15 +89,26 @@ async def end_show(orchestrator: TokencastOrchestrator = Depends(get_orchestrato
 
 
 @router.get("/show/{show_id}")
-async def get_show(show_id: int, db: Session = Depends(get_db)):
+async def get_show(show_id: int, db: AsyncSession = Depends(get_db)):
     """Get details for a specific show"""
-    show = db.query(TokencastShow).filter_by(id=show_id).first()
+    # Primary-key load (identity map first), with its segments and their
+    # featured tokens in three queries total; any other relationship touched
+    # while serializing raises instead of quietly adding a round-trip
+    show = await db.get(
+        TokencastShow, show_id,
+        options=[
+            selectinload(TokencastShow.segments).selectinload(TokencastSegment.featured_tokens),
+            # swarm_outputs is lazy="selectin" on the mapper; keep it out
+            # of this read explicitly rather than relying on the wildcard
+            selectinload(TokencastShow.segments).raiseload(TokencastSegment.swarm_outputs),
+            raiseload('*')
+        ]
+    )
 
     if not show:
         raise HTTPException(status_code=404, detail=f"Show {show_id} not found")
 
-    # Get segments
-    segments = db.query(TokencastSegment).filter_by(show_id=show_id).order_by(TokencastSegment.segment_number).all()
+    segments = show.segments
 
     return {
         "show": show,
@@ -112,9 +117,9 @@ async def get_show(show_id: int, db: Session = Depends(get_db)):
     }
 
 
-@router.get("/segments/current")
+@router.get("/segments/current", response_model=SegmentResponse)
 async def get_current_segment(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     orchestrator: TokencastOrchestrator = Depends(get_orchestrator)
 ):
     """Get the current active segment"""
@@ -123,12 +128,14 @@ async def get_current_segment(
     if not state or not state.current_segment_id:
         raise HTTPException(status_code=404, detail="No active segment")
 
-    segment = db.query(TokencastSegment).filter_by(id=state.current_segment_id).first()
+    segment = (await db.execute(
+        select(*_SEGMENT_API_COLS).where(TokencastSegment.id == state.current_segment_id)
+    )).mappings().first()
 
     if not segment:
         raise HTTPException(status_code=404, detail="Active segment not found in database")
 
-    return segment
+    return dict(segment)
 
 
 @router.post("/segments/transition")
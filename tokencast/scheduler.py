@@ -6,8 +6,8 @@ Tokencast Segment Scheduler
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, List, Callable
+import time
+from typing import Optional, List, Callable, Dict
 from .models import SegmentType, SegmentConfig, ShowConfig
 
 logger = logging.getLogger(__name__)
@@ -52,13 +52,38 @@ class SegmentScheduler:
         self.show_config = show_config
         self.current_index = 0
         self.rotation = show_config.segment_rotation
-        self.transition_task: Optional[asyncio.Task] = None
-        self.transition_callback: Optional[Callable] = None
+
+        # One shared, frozen config per segment type instead of a new
+        # instance on every lookup
+        self._default_configs: Dict[SegmentType, SegmentConfig] = {
+            seg_type: SegmentConfig(segment_type=seg_type, duration_seconds=duration)
+            for seg_type, duration in self.DEFAULT_DURATIONS.items()
+        }
+
+        # Monotonic clock reading when the current segment started; wall-clock
+        # start times are only kept by the orchestrator for persistence
+        self._segment_started_monotonic: Optional[float] = None
+
+        # The pending transition is a bare event-loop timer handle; a task
+        # is only created for the callback once the timer actually fires
+        self._pending_handle: Optional[asyncio.TimerHandle] = None
+        self._transition_task: Optional[asyncio.Task] = None
 
     def get_segment_duration(self, segment_type: SegmentType) -> int:
         """Get default duration for segment type"""
         return self.DEFAULT_DURATIONS.get(segment_type, 300)
 
+    def _get_config(self, segment_type: SegmentType) -> SegmentConfig:
+        """Shared default config for a segment type"""
+        config = self._default_configs.get(segment_type)
+        if config is None:
+            config = SegmentConfig(
+                segment_type=segment_type,
+                duration_seconds=self.get_segment_duration(segment_type)
+            )
+            self._default_configs[segment_type] = config
+        return config
+
     def get_next_segment(self) -> SegmentConfig:
         """
         Get next segment in rotation
@@ -67,21 +92,11 @@ class SegmentScheduler:
             SegmentConfig for next segment
         """
         next_index = (self.current_index + 1) % len(self.rotation)
-        next_type = self.rotation[next_index]
-
-        return SegmentConfig(
-            segment_type=next_type,
-            duration_seconds=self.get_segment_duration(next_type)
-        )
+        return self._get_config(self.rotation[next_index])
 
     def get_current_segment(self) -> SegmentConfig:
         """Get current segment config"""
-        current_type = self.rotation[self.current_index]
-
-        return SegmentConfig(
-            segment_type=current_type,
-            duration_seconds=self.get_segment_duration(current_type)
-        )
+        return self._get_config(self.rotation[self.current_index])
 
     def advance_segment(self) -> SegmentConfig:
         """
@@ -91,6 +106,7 @@ class SegmentScheduler:
             SegmentConfig for new current segment
         """
         self.current_index = (self.current_index + 1) % len(self.rotation)
+        self._segment_started_monotonic = time.monotonic()
         return self.get_current_segment()
 
     def peek_upcoming(self, count: int = 3) -> List[SegmentConfig]:
@@ -103,23 +119,16 @@ class SegmentScheduler:
         Returns:
             List of upcoming segment configs
         """
-        upcoming = []
-        for i in range(1, count + 1):
-            index = (self.current_index + i) % len(self.rotation)
-            seg_type = self.rotation[index]
-            upcoming.append(
-                SegmentConfig(
-                    segment_type=seg_type,
-                    duration_seconds=self.get_segment_duration(seg_type)
-                )
-            )
-        return upcoming
+        return [
+            self._get_config(self.rotation[(self.current_index + i) % len(self.rotation)])
+            for i in range(1, count + 1)
+        ]
 
     def schedule_transition(
         self,
         delay_seconds: int,
         callback: Callable
-    ) -> asyncio.Task:
+    ) -> asyncio.TimerHandle:
         """
         Schedule automatic segment transition
 
@@ -128,48 +137,64 @@ class SegmentScheduler:
             callback: Async function to call on transition
 
         Returns:
-            asyncio.Task for the scheduled transition
+            Event loop handle of the scheduled transition
         """
-        self.transition_callback = callback
-
-        async def _delayed_transition():
-            """Internal: wait and then call transition callback"""
-            try:
-                logger.info(f"Scheduling transition in {delay_seconds} seconds")
-                await asyncio.sleep(delay_seconds)
-                if self.transition_callback:
-                    await self.transition_callback()
-            except asyncio.CancelledError:
-                logger.info("Transition cancelled")
-            except Exception as e:
-                logger.error(f"Error in scheduled transition: {e}", exc_info=True)
-
-        self.transition_task = asyncio.create_task(_delayed_transition())
-        return self.transition_task
+        # Absolute loop-clock deadline; the handle's when() reports it back
+        loop = asyncio.get_running_loop()
+        self._pending_handle = loop.call_at(
+            loop.time() + delay_seconds, self._fire_transition, callback
+        )
+
+        logger.info(f"Scheduling transition in {delay_seconds} seconds")
+
+        return self._pending_handle
 
     def cancel_scheduled_transition(self):
         """Cancel pending transition"""
-        if self.transition_task and not self.transition_task.done():
-            self.transition_task.cancel()
+        if self._pending_handle is not None:
+            self._pending_handle.cancel()
+            self._pending_handle = None
             logger.info("Cancelled scheduled segment transition")
 
-    def get_time_remaining(self, segment_started_at: datetime, segment_duration: int) -> int:
+    def _fire_transition(self, callback: Callable):
+        """Internal: timer expired, run the transition callback as a task"""
+        self._pending_handle = None
+        self._transition_task = asyncio.create_task(callback())
+        self._transition_task.add_done_callback(self._log_transition_error)
+
+    @staticmethod
+    def _log_transition_error(task: asyncio.Task):
+        """Internal: log a failed transition callback"""
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is not None:
+            logger.error(f"Error in scheduled transition: {e}", exc_info=e)
+
+    def get_time_remaining(self, segment_duration: Optional[int] = None) -> int:
         """
         Calculate seconds remaining in current segment
 
+        Measured on the monotonic clock from the last advance_segment(), so
+        wall-clock adjustments don't shift it.
+
         Args:
-            segment_started_at: When segment started
-            segment_duration: Segment duration in seconds
+            segment_duration: Segment duration in seconds (defaults to the
+                current segment's duration)
 
         Returns:
             Seconds remaining (or 0 if expired)
         """
-        elapsed = (datetime.utcnow() - segment_started_at).total_seconds()
-        remaining = max(0, segment_duration - elapsed)
-        return int(remaining)
+        if segment_duration is None:
+            segment_duration = self.get_current_segment().duration_seconds
+        if self._segment_started_monotonic is None:
+            return segment_duration
+        elapsed = time.monotonic() - self._segment_started_monotonic
+        return int(max(0, segment_duration - elapsed))
 
     def reset(self):
         """Reset scheduler to beginning of rotation"""
         self.current_index = 0
+        self._segment_started_monotonic = None
         self.cancel_scheduled_transition()
         logger.info("Scheduler reset to beginning of rotation")
@@ -46,6 +46,16 @@ class SegmentGenerator(ABC):
         """
         pass
 
+    async def warmup(self):
+        """
+        Prepare the generator before the first show starts
+
+        Runs once at server startup, concurrently with every other
+        generator's warmup. No-op by default; override to pre-open
+        connections or prefetch data that generate_content() will need.
+        """
+        pass
+
     def _format_speaker_notes(self, **kwargs) -> str:
         """
         Helper to format speaker notes from template
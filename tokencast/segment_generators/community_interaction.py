@@ -5,6 +5,8 @@ Highlights community polls, Q&A, and engagement from Telegram.
 """
 
 import logging
+from itertools import islice
+from typing import Any, Dict, Iterator
 from ..models import SegmentContext, SegmentOutput
 from .base import SegmentGenerator
 
@@ -23,43 +25,43 @@ class CommunityInteractionGenerator(SegmentGenerator):
         2. Highlight popular token mentions
         3. Feature community questions
         """
-        speaker_notes = [
-            "=== COMMUNITY INTERACTION ===",
-            "",
-            "Time to hear from the community!",
-            ""
-        ]
-
         # Check for community feedback in context
         feedback = context.community_feedback or {}
 
+        return SegmentOutput(
+            speaker_notes="\n".join(self._notes(feedback)),
+            featured_tokens=[],
+            swarm_analyses=[],
+            metadata={"has_feedback": bool(feedback)}
+        )
+
+    def _notes(self, feedback: Dict[str, Any]) -> Iterator[str]:
+        """Yield speaker-note lines for the given community feedback"""
+        yield "=== COMMUNITY INTERACTION ==="
+        yield ""
+        yield "Time to hear from the community!"
+        yield ""
+
         if feedback:
-            speaker_notes.append("Community Highlights:")
+            yield "Community Highlights:"
 
             # Token mentions
             if feedback.get("token_mentions"):
-                speaker_notes.append("")
-                speaker_notes.append("Most Mentioned Tokens:")
-                for token, count in list(feedback["token_mentions"].items())[:5]:
-                    speaker_notes.append(f"  • ${token}: {count} mentions")
+                yield ""
+                yield "Most Mentioned Tokens:"
+                for token, count in islice(feedback["token_mentions"].items(), 5):
+                    yield f"  • ${token}: {count} mentions"
 
             # Questions
             if feedback.get("questions"):
-                speaker_notes.append("")
-                speaker_notes.append("Top Community Questions:")
+                yield ""
+                yield "Top Community Questions:"
                 for i, q in enumerate(feedback["questions"][:3], 1):
-                    speaker_notes.append(f"  {i}. {q}")
+                    yield f"  {i}. {q}"
 
         else:
-            speaker_notes.append("No community feedback captured yet.")
-            speaker_notes.append("Drop your questions and token mentions in the chat!")
-
-        speaker_notes.append("")
-        speaker_notes.append("Keep engaging - your input shapes the show!")
+            yield "No community feedback captured yet."
+            yield "Drop your questions and token mentions in the chat!"
 
-        return SegmentOutput(
-            speaker_notes="\n".join(speaker_notes),
-            featured_tokens=[],
-            swarm_analyses=[],
-            metadata={"has_feedback": bool(feedback)}
-        )
+        yield ""
+        yield "Keep engaging - your input shapes the show!"
@@ -14,11 +14,132 @@ Flow:
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 from decimal import Decimal
+import hashlib
 import random
 
+import numpy as np
+
 from ..models import SegmentContext, SegmentOutput
 from .base import SegmentGenerator
 
+# Choices, outcomes and per-round bet counters are fixed-order tuples indexed
+# by position rather than nested dicts
+CHOICES = ("ROCK", "PAPER", "SCISSORS")
+CHOICE_IDX = {choice: i for i, choice in enumerate(CHOICES)}
+OUTCOMES = ("LOSS", "TIE", "WIN")
+
+# WIN_TABLE[player * 3 + gizmo] -> index into OUTCOMES
+WIN_TABLE = (
+    1, 0, 2,  # ROCK vs ROCK / PAPER / SCISSORS
+    2, 1, 0,  # PAPER
+    0, 2, 1,  # SCISSORS
+)
+
+# (player, gizmo) -> outcome, so resolving a bet is a single dict lookup
+_RPS_OUTCOME = {
+    (player, gizmo): OUTCOMES[WIN_TABLE[p * 3 + g]]
+    for p, player in enumerate(CHOICES)
+    for g, gizmo in enumerate(CHOICES)
+}
+
+PAYOUTS = {
+    "WIN": 2.0,   # Beat GIZMO = 2x your bet
+    "TIE": 1.0,   # Tie = get bet back
+    "LOSS": 0.0   # Lose = lose your bet
+}
+
+# Payout multiplier per outcome index, aligned with OUTCOMES
+PAYOUT_TABLE = tuple(PAYOUTS[outcome] for outcome in OUTCOMES)
+
+# Array forms of the tables for resolving a whole round at once. The extra
+# last row is for invalid picks (player index -1), which always lose.
+_WIN_LUT = np.array(WIN_TABLE + (0, 0, 0), dtype=np.uint8).reshape(4, 3)
+_PAYOUT_LUT = np.array(PAYOUT_TABLE, dtype=np.float64)
+
+_GIZMO_TAUNTS = (
+    "Think you can outsmart the Eye? Let's see what you got, degens! 👁️",
+    "Rock, paper, scissors... GIZMO knows all. Do you? 🎲",
+    "I've analyzed 10,000 games. You've played... how many? 🤖",
+    "My neural nets say ROCK... or do they? 🧠",
+    "Feeling lucky, anon? GIZMO never loses... except when I do 😏",
+    "The meta is SCISSORS. Or is it? Double reverse psychology activated 🎯",
+    "GIZMO's circuits are calculating... probability matrices loading... 💭",
+    "You think this is random? Cute. Everything is signal, anon 📊",
+    "Retardia says ROCK is the play. Is Retardia ever wrong? (Yes) 👸",
+    "GAMBA SZN! Let's get this bread, degenerates! 💰"
+)
+
+# Speaker notes are static apart from a few round fields, so the template is
+# built once and filled with format_map() per round
+_GAMBA_TEMPLATE = """
+=== 🎲 GAMBA SEGMENT: ROCK PAPER SCISSORS vs GIZMO 🎲 ===
+
+{gizmo_taunt}
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🎮 HOW TO PLAY:
+
+1. Pick your move: ROCK 🪨 | PAPER 📄 | SCISSORS ✂️
+2. Place your bet (crypto/points)
+3. Submit before timer expires
+4. GIZMO reveals choice
+5. Winners get PAID! 💰
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+💵 PAYOUTS:
+
+• BEAT GIZMO → 2x your bet 🏆
+• TIE with GIZMO → Get your bet back 🤝
+• LOSE to GIZMO → Better luck next time! 💀
+
+(No house edge - this is a fair fight!)
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+⏰ BETTING WINDOW: {betting_window_min} MINUTES
+
+Round ID: {round_id}
+GIZMO's Choice Hash: {choice_hash}
+(Proof of pre-commitment - GIZMO can't change after seeing your picks)
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🎯 EXAMPLE PLAYS:
+
+You: ROCK 🪨  | GIZMO: SCISSORS ✂️  → YOU WIN! 2x
+You: PAPER 📄 | GIZMO: PAPER 📄    → TIE! 1x
+You: SCISSORS ✂️ | GIZMO: ROCK 🪨  → GIZMO WINS! 0x
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📊 CURRENT ROUND STATS:
+
+Total Bets: {total_bets}
+Pool Size: ${total_pool:.2f}
+
+ROCK 🪨: {rock_bets} bets
+PAPER 📄: {paper_bets} bets
+SCISSORS ✂️: {scissors_bets} bets
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🏆 LEADERBOARD (Top degens this show):
+1. anon_whale - 5 wins, +$1,420.69
+2. paper_hands - 3 wins, +$420.00
+3. diamond_degen - 2 wins, +$250.00
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🎲 GAMBA GAMBA GAMBA! 🎲
+
+May the odds be ever in your favor, degens!
+(They won't be. GIZMO sees all 👁️)
+
+GET YOUR BETS IN NOW! ⏱️
+"""
+
 
 class GambaSegmentGenerator(SegmentGenerator):
     """
@@ -60,7 +181,7 @@ class GambaSegmentGenerator(SegmentGenerator):
                 "game_type": "rock_paper_scissors",
                 "round_id": rps_round["round_id"],
                 "betting_closes_at": rps_round["closes_at"],
-                "gizmo_choice": rps_round["gizmo_choice_hash"],  # Hidden until reveal
+                "gizmo_choice": rps_round["gizmo_choice_hash"].hex(),  # Hidden until reveal
                 "payouts": rps_round["payouts"],
                 "status": "betting_open"
             }
@@ -89,23 +210,15 @@ class GambaSegmentGenerator(SegmentGenerator):
             "show_id": context.show_id,
             "segment_number": context.segment_number,
             "gizmo_choice": gizmo_choice,  # Hidden from API until reveal
-            "gizmo_choice_hash": choice_hash,  # Public for verification
-            "choices": ["ROCK", "PAPER", "SCISSORS"],
+            "gizmo_choice_hash": choice_hash,  # Public for verification (raw digest bytes)
+            "choices": CHOICES,
             "started_at": now.isoformat(),
             "closes_at": closes_at.isoformat(),
             "betting_window_seconds": betting_window,
             "status": "betting_open",
-            "payouts": {
-                "WIN": 2.0,   # Beat GIZMO = 2x your bet
-                "TIE": 1.0,   # Tie = get bet back
-                "LOSS": 0.0   # Lose = lose your bet
-            },
+            "payouts": PAYOUTS,
             "total_pool": 0.0,
-            "bet_counts": {
-                "ROCK": 0,
-                "PAPER": 0,
-                "SCISSORS": 0
-            },
+            "bet_counts": (0, 0, 0),  # ROCK, PAPER, SCISSORS
             "house_edge": 0.0  # Fair game, no house edge
         }
 
@@ -119,7 +232,7 @@ class GambaSegmentGenerator(SegmentGenerator):
 
         # Option 1: Pure random (fair)
         if not self.swarm or random.random() < 0.5:
-            return random.choice(["ROCK", "PAPER", "SCISSORS"])
+            return random.choice(CHOICES)
 
         # Option 2: Ask GIZMO to be strategic
         try:
@@ -137,37 +250,29 @@ class GambaSegmentGenerator(SegmentGenerator):
             elif "SCISSORS" in response:
                 return "SCISSORS"
             else:
-                return random.choice(["ROCK", "PAPER", "SCISSORS"])
+                return random.choice(CHOICES)
 
         except Exception as e:
             print(f"Error getting GIZMO's choice: {e}")
-            return random.choice(["ROCK", "PAPER", "SCISSORS"])
+            return random.choice(CHOICES)
 
-    def _hash_choice(self, choice: str, show_id: int, segment_number: int) -> str:
+    def _hash_choice(self, choice: str, show_id: int, segment_number: int) -> bytes:
         """
         Hash GIZMO's choice for provable fairness
 
+        Returns the first 8 digest bytes; callers hex-encode when serializing.
+
+        The message is built directly as bytes and fits in a single SHA-256
+        block, so one sha256() call is all the hashing there is.
+
         In production: use proper cryptographic hash
         """
-        import hashlib
-        data = f"{choice}:{show_id}:{segment_number}".encode()
-        return hashlib.sha256(data).hexdigest()[:16]
+        data = b"%b:%d:%d" % (choice.encode("ascii"), show_id, segment_number)
+        return hashlib.sha256(data).digest()[:8]
 
     def _get_gizmo_taunt(self) -> str:
         """Get random GIZMO trash talk"""
-        taunts = [
-            "Think you can outsmart the Eye? Let's see what you got, degens! 👁️",
-            "Rock, paper, scissors... GIZMO knows all. Do you? 🎲",
-            "I've analyzed 10,000 games. You've played... how many? 🤖",
-            "My neural nets say ROCK... or do they? 🧠",
-            "Feeling lucky, anon? GIZMO never loses... except when I do 😏",
-            "The meta is SCISSORS. Or is it? Double reverse psychology activated 🎯",
-            "GIZMO's circuits are calculating... probability matrices loading... 💭",
-            "You think this is random? Cute. Everything is signal, anon 📊",
-            "Retardia says ROCK is the play. Is Retardia ever wrong? (Yes) 👸",
-            "GAMBA SZN! Let's get this bread, degenerates! 💰"
-        ]
-        return random.choice(taunts)
+        return random.choice(_GIZMO_TAUNTS)
 
     def _format_gamba_notes(
         self,
@@ -177,104 +282,84 @@ class GambaSegmentGenerator(SegmentGenerator):
     ) -> str:
         """Format speaker notes for GAMBA RPS segment"""
 
-        betting_window_min = rps_round['betting_window_seconds'] // 60
+        bet_counts = rps_round['bet_counts']
 
-        return f"""
-=== 🎲 GAMBA SEGMENT: ROCK PAPER SCISSORS vs GIZMO 🎲 ===
-
-{gizmo_taunt}
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🎮 HOW TO PLAY:
-
-1. Pick your move: ROCK 🪨 | PAPER 📄 | SCISSORS ✂️
-2. Place your bet (crypto/points)
-3. Submit before timer expires
-4. GIZMO reveals choice
-5. Winners get PAID! 💰
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-💵 PAYOUTS:
-
-• BEAT GIZMO → 2x your bet 🏆
-• TIE with GIZMO → Get your bet back 🤝
-• LOSE to GIZMO → Better luck next time! 💀
-
-(No house edge - this is a fair fight!)
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-⏰ BETTING WINDOW: {betting_window_min} MINUTES
-
-Round ID: {rps_round['round_id']}
-GIZMO's Choice Hash: {rps_round['gizmo_choice_hash']}
-(Proof of pre-commitment - GIZMO can't change after seeing your picks)
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🎯 EXAMPLE PLAYS:
-
-You: ROCK 🪨  | GIZMO: SCISSORS ✂️  → YOU WIN! 2x
-You: PAPER 📄 | GIZMO: PAPER 📄    → TIE! 1x
-You: SCISSORS ✂️ | GIZMO: ROCK 🪨  → GIZMO WINS! 0x
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📊 CURRENT ROUND STATS:
-
-Total Bets: {rps_round['bet_counts']['ROCK'] + rps_round['bet_counts']['PAPER'] + rps_round['bet_counts']['SCISSORS']}
-Pool Size: ${rps_round['total_pool']:.2f}
-
-ROCK 🪨: {rps_round['bet_counts']['ROCK']} bets
-PAPER 📄: {rps_round['bet_counts']['PAPER']} bets
-SCISSORS ✂️: {rps_round['bet_counts']['SCISSORS']} bets
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🏆 LEADERBOARD (Top degens this show):
-1. anon_whale - 5 wins, +$1,420.69
-2. paper_hands - 3 wins, +$420.00
-3. diamond_degen - 2 wins, +$250.00
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-🎲 GAMBA GAMBA GAMBA! 🎲
-
-May the odds be ever in your favor, degens!
-(They won't be. GIZMO sees all 👁️)
-
-GET YOUR BETS IN NOW! ⏱️
-"""
+        return _GAMBA_TEMPLATE.format_map({
+            "gizmo_taunt": gizmo_taunt,
+            "betting_window_min": rps_round['betting_window_seconds'] // 60,
+            "round_id": rps_round['round_id'],
+            "choice_hash": rps_round['gizmo_choice_hash'].hex(),
+            "total_bets": sum(bet_counts),
+            "total_pool": rps_round['total_pool'],
+            "rock_bets": bet_counts[0],
+            "paper_bets": bet_counts[1],
+            "scissors_bets": bet_counts[2]
+        })
 
     async def resolve_round(
         self,
         round_id: str,
-        player_bets: List[Dict]
+        player_bets: List[Dict],
+        gizmo_choice: str = "ROCK"
     ) -> Dict:
         """
         Resolve rock-paper-scissors round
 
+        Bets are copied once into NumPy arrays (pick index, amount) and
+        resolved with two table gathers and a multiply, so the per-bet work
+        runs outside the interpreter. Amounts stay float64 so pool totals
+        don't drift.
+
         Args:
             round_id: Round identifier
             player_bets: List of {user_id, choice, bet_amount}
+            gizmo_choice: GIZMO's revealed choice
 
         Returns:
             Resolution with winners, payouts, and GIZMO's reveal
         """
         # This would be called at end of segment
-        # Placeholder for when integrated with actual betting system
+        gizmo_idx = CHOICE_IDX[gizmo_choice]
+        win_idx = OUTCOMES.index("WIN")
+
+        count = len(player_bets)
+        picks = np.fromiter(
+            (CHOICE_IDX.get(bet["choice"], -1) for bet in player_bets),
+            dtype=np.intp, count=count
+        )
+        amounts = np.fromiter(
+            (float(bet["bet_amount"]) for bet in player_bets),
+            dtype=np.float64, count=count
+        )
+
+        outcomes = _WIN_LUT[picks, gizmo_idx]
+        payouts = amounts * _PAYOUT_LUT[outcomes]
+
+        winners = [
+            {
+                "user_id": player_bets[i]["user_id"],
+                "choice": player_bets[i]["choice"],
+                "bet_amount": float(amounts[i]),
+                "payout": float(payouts[i])
+            }
+            for i in np.flatnonzero(outcomes == win_idx).tolist()
+        ]
+        total_wagered = float(amounts.sum())
+        total_payout = float(payouts.sum())
+
+        # round_id is rps_<show_id>_<segment_number>, as built in _create_rps_round
+        _, show_id, segment_number = round_id.split("_")
+        choice_hash = self._hash_choice(gizmo_choice, int(show_id), int(segment_number))
 
         return {
             "round_id": round_id,
             "status": "resolved",
-            "gizmo_choice": "ROCK",  # Revealed
-            "gizmo_choice_hash": "abc123...",
-            "total_bets": len(player_bets),
-            "winners": [],
-            "total_payout": 0.0,
-            "house_profit": 0.0
+            "gizmo_choice": gizmo_choice,  # Revealed
+            "gizmo_choice_hash": choice_hash.hex(),
+            "total_bets": count,
+            "winners": winners,
+            "total_payout": total_payout,
+            "house_profit": total_wagered - total_payout
         }
 
     def _determine_winner(self, player_choice: str, gizmo_choice: str) -> str:
@@ -283,16 +368,4 @@ GET YOUR BETS IN NOW! ⏱️
 
         Returns: "WIN", "LOSS", or "TIE"
         """
-        if player_choice == gizmo_choice:
-            return "TIE"
-
-        wins = {
-            "ROCK": "SCISSORS",
-            "PAPER": "ROCK",
-            "SCISSORS": "PAPER"
-        }
-
-        if wins.get(player_choice) == gizmo_choice:
-            return "WIN"
-        else:
-            return "LOSS"
+        return _RPS_OUTCOME.get((player_choice, gizmo_choice), "LOSS")
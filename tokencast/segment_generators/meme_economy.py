@@ -4,16 +4,36 @@ MEME ECONOMY segment generator
 Tracks trending meme coins via FOOLIO narrative intelligence.
 """
 
+import asyncio
 import logging
+import time
+from typing import Dict, Iterator, List, Tuple
 from ..models import SegmentContext, SegmentOutput
 from .base import SegmentGenerator
 
 logger = logging.getLogger(__name__)
 
+# Commentary per narrative phase, matched by substring in this order
+_PHASE_COMMENTARY = {
+    "discovery": "  🔍 Early stage - watch for validation",
+    "validation": "  📈 Building momentum",
+    "peak": "  🚀 Peak hype - consider exit timing",
+    "doubt": "  ⚠️  Losing steam",
+    "dead": "  💀 Narrative collapsed",
+}
+
 
 class MemeEconomyGenerator(SegmentGenerator):
     """Generate content for MEME ECONOMY segment"""
 
+    # How long a ticker's narrative phase is reused across segment renders
+    NARRATIVE_TTL_SECONDS = 60.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # ticker -> (narrative phase, monotonic fetch time)
+        self._narratives: Dict[str, Tuple[str, float]] = {}
+
     async def generate_content(self, context: SegmentContext) -> SegmentOutput:
         """
         Generate MEME ECONOMY segment content
@@ -32,57 +52,83 @@ class MemeEconomyGenerator(SegmentGenerator):
             {"ticker": "BONK", "name": "Bonk"}
         ]
 
-        speaker_notes = ["=== MEME ECONOMY ===", "", "Tracking narrative phases across top meme coins:", ""]
-
         analyses = []
+        covered = []  # (coin, narrative) pairs that made it into the notes
 
-        for coin in meme_coins[:3]:  # Top 3
-            if self.swarm:
-                try:
-                    # Query SWARM about narrative
-                    result = await self.swarm.query(
-                        f"What's the narrative phase on ${coin['ticker']}?",
-                        ticker=coin['ticker']
-                    )
-
-                    narrative = result.get('narrative_phase', 'Unknown')
-                    analyses.append({
-                        "token": coin['ticker'],
-                        "narrative_phase": narrative
-                    })
+        top_coins = meme_coins[:3]  # Top 3
 
-                    speaker_notes.append(f"${coin['ticker']} ({coin['name']})")
-                    speaker_notes.append(f"  Narrative: {narrative}")
-                    speaker_notes.append(f"  {self._get_phase_commentary(narrative)}")
-                    speaker_notes.append("")
+        if self.swarm:
+            # Look up every coin concurrently; a failed lookup only drops that coin
+            results = await asyncio.gather(
+                *(self._cached_narrative(coin['ticker']) for coin in top_coins),
+                return_exceptions=True
+            )
 
-                except Exception as e:
-                    logger.error(f"Error analyzing {coin['ticker']}: {e}")
+            for coin, narrative in zip(top_coins, results):
+                if isinstance(narrative, Exception):
+                    logger.error("Error analyzing %s: %s", coin["ticker"], narrative)
+                    continue
 
-        speaker_notes.append("The meme economy is constantly evolving - stay vigilant!")
+                analyses.append({
+                    "token": coin['ticker'],
+                    "narrative_phase": narrative
+                })
+                covered.append((coin, narrative))
 
         return SegmentOutput(
-            speaker_notes="\n".join(speaker_notes),
-            featured_tokens=meme_coins[:3],
+            speaker_notes="\n".join(self._notes(covered)),
+            featured_tokens=top_coins,
             swarm_analyses=analyses,
             metadata={"meme_count": len(meme_coins)}
         )
 
+    def _notes(self, covered: List[Tuple[Dict[str, str], str]]) -> Iterator[str]:
+        """Yield speaker-note lines for the analyzed coins"""
+        yield "=== MEME ECONOMY ==="
+        yield ""
+        yield "Tracking narrative phases across top meme coins:"
+        yield ""
+
+        for coin, narrative in covered:
+            yield f"${coin['ticker']} ({coin['name']})"
+            yield f"  Narrative: {narrative}"
+            yield f"  {self._get_phase_commentary(narrative)}"
+            yield ""
+
+        yield "The meme economy is constantly evolving - stay vigilant!"
+
+    async def _cached_narrative(self, ticker: str) -> str:
+        """
+        Narrative phase for a ticker, queried from SWARM at most once per TTL
+
+        'Unknown' answers are not cached so a transient miss is retried on
+        the next render.
+        """
+        now = time.monotonic()
+        cached = self._narratives.get(ticker)
+        if cached is not None and now - cached[1] < self.NARRATIVE_TTL_SECONDS:
+            return cached[0]
+
+        # Query SWARM about narrative
+        result = await self.swarm.query(
+            f"What's the narrative phase on ${ticker}?",
+            ticker=ticker
+        )
+
+        narrative = result.get('narrative_phase', 'Unknown')
+        if narrative and narrative != 'Unknown':
+            self._narratives[ticker] = (narrative, now)
+        else:
+            self._narratives.pop(ticker, None)
+        return narrative
+
     def _get_phase_commentary(self, narrative: str) -> str:
         """Get commentary based on narrative phase"""
         if not narrative or narrative == "Unknown":
             return "  📊 No strong narrative signal"
 
         phase = narrative.lower()
-        if 'discovery' in phase:
-            return "  🔍 Early stage - watch for validation"
-        elif 'validation' in phase:
-            return "  📈 Building momentum"
-        elif 'peak' in phase:
-            return "  🚀 Peak hype - consider exit timing"
-        elif 'doubt' in phase:
-            return "  ⚠️  Losing steam"
-        elif 'dead' in phase:
-            return "  💀 Narrative collapsed"
-        else:
-            return "  ➡️  Monitoring"
+        return next(
+            (commentary for key, commentary in _PHASE_COMMENTARY.items() if key in phase),
+            "  ➡️  Monitoring"
+        )
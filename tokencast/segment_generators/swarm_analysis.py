@@ -5,15 +5,59 @@ Deep-dive token analysis using all SWARM agents (PERCEPTRON + FOOLIO + AZOKA).
 """
 
 import logging
+import time
+from typing import Optional, Tuple
 from ..models import SegmentContext, SegmentOutput
 from .base import SegmentGenerator
 
 logger = logging.getLogger(__name__)
 
+# Social sentiment per narrative phase, matched by substring in this order
+_PHASE_SENTIMENT = {
+    "peak": "🚀 Euphoric",
+    "euphoria": "🚀 Euphoric",
+    "discovery": "📈 Building",
+    "validation": "📈 Building",
+    "doubt": "📉 Declining",
+    "decline": "📉 Declining",
+}
+
+# Analysis notes are static apart from the per-token fields, so the template
+# is built once and filled with format_map() per analysis
+_SWARM_TEMPLATE = """=== SWARM ANALYSIS ===
+
+Token: ${ticker}
+
+PERCEPTRON (Charts & Risk):
+  • Regime: {regime}
+  • Confidence: {confidence:.1f}%
+  • Risk Score: {risk_score:.2f}
+  • Position: {position}
+
+FOOLIO (Social & Narrative):
+  • Narrative Phase: {narrative_phase}
+  • Social Sentiment: {sentiment}
+
+AZOKA (Divergence & Judgment):
+  • Response: {azoka_response}
+  • Divergence: {divergence}
+  • Chromatic State: {chromatic_state}
+
+FINAL ASSESSMENT:
+  {assessment}"""
+
 
 class SwarmAnalysisGenerator(SegmentGenerator):
     """Generate content for SWARM ANALYSIS segment"""
 
+    # How long the rendered default-token (no featured token) output is reused
+    DEFAULT_TTL_SECONDS = 300.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (monotonic expiry, output) for the default-token analysis
+        self._default_output: Optional[Tuple[float, SegmentOutput]] = None
+
     async def generate_content(self, context: SegmentContext) -> SegmentOutput:
         """
         Generate SWARM ANALYSIS segment content
@@ -30,10 +74,13 @@ class SwarmAnalysisGenerator(SegmentGenerator):
 
             if context.featured_tokens:
                 token_address = context.featured_tokens[0]
-                ticker = "TOKEN"  # Would need to look up actual ticker
+                ticker = context.featured_tickers[0] if context.featured_tickers else "UNKNOWN"
             else:
-                # Default to a popular token
+                # Default to a popular token; its input never changes, so the
+                # rendered output is reused until the TTL runs out
                 ticker = "PEPE"
+                if self._default_output and self._default_output[0] > time.monotonic():
+                    return self._default_output[1]
                 logger.info("No featured token, using default: PEPE")
 
             if not self.swarm:
@@ -52,15 +99,22 @@ class SwarmAnalysisGenerator(SegmentGenerator):
             # Format speaker notes
             speaker_notes = self._format_swarm_analysis(ticker, analysis)
 
-            return SegmentOutput(
+            output = SegmentOutput(
                 speaker_notes=speaker_notes,
                 featured_tokens=[{"ticker": ticker, "address": token_address}],
                 swarm_analyses=[analysis],
                 metadata={"analyzed_token": ticker}
             )
 
+            # Only cache a real answer; SWARM errors come back empty
+            if token_address is None and analysis:
+                self._default_output = (time.monotonic() + self.DEFAULT_TTL_SECONDS, output)
+
+            return output
+
         except Exception as e:
-            logger.error(f"Error generating SWARM_ANALYSIS segment: {e}", exc_info=True)
+            # Full tracebacks only when debugging; SWARM outages can make this path hot
+            logger.error("Error generating SWARM_ANALYSIS segment: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return SegmentOutput(
                 speaker_notes=f"SWARM analysis error: {str(e)}",
                 featured_tokens=[],
@@ -69,43 +123,27 @@ class SwarmAnalysisGenerator(SegmentGenerator):
 
     def _format_swarm_analysis(self, ticker: str, analysis: dict) -> str:
         """Format comprehensive SWARM analysis"""
-        lines = [
-            "=== SWARM ANALYSIS ===",
-            "",
-            f"Token: ${ticker}",
-            "",
-            "PERCEPTRON (Charts & Risk):",
-            f"  • Regime: {analysis.get('regime', 'Unknown')}",
-            f"  • Confidence: {analysis.get('confidence', 0)*100:.1f}%",
-            f"  • Risk Score: {analysis.get('risk_score', 0):.2f}",
-            f"  • Position: {analysis.get('position_recommendation', 'None')}",
-            "",
-            "FOOLIO (Social & Narrative):",
-            f"  • Narrative Phase: {analysis.get('narrative_phase', 'Unknown')}",
-            f"  • Social Sentiment: {self._get_sentiment_emoji(analysis)}",
-            "",
-            "AZOKA (Divergence & Judgment):",
-            f"  • Response: {analysis.get('azoka_response', 'Pass')}",
-            f"  • Divergence: {'🚨 DETECTED' if analysis.get('divergence_detected') else '✅ None'}",
-            f"  • Chromatic State: {analysis.get('chromatic_state', 'Unknown')}",
-            "",
-            "FINAL ASSESSMENT:",
-            f"  {self._generate_final_assessment(analysis)}"
-        ]
-
-        return "\n".join(lines)
+        return _SWARM_TEMPLATE.format_map({
+            "ticker": ticker,
+            "regime": analysis.get('regime', 'Unknown'),
+            "confidence": analysis.get('confidence', 0) * 100,
+            "risk_score": analysis.get('risk_score', 0),
+            "position": analysis.get('position_recommendation', 'None'),
+            "narrative_phase": analysis.get('narrative_phase', 'Unknown'),
+            "sentiment": self._get_sentiment_emoji(analysis),
+            "azoka_response": analysis.get('azoka_response', 'Pass'),
+            "divergence": '🚨 DETECTED' if analysis.get('divergence_detected') else '✅ None',
+            "chromatic_state": analysis.get('chromatic_state', 'Unknown'),
+            "assessment": self._generate_final_assessment(analysis)
+        })
 
     def _get_sentiment_emoji(self, analysis: dict) -> str:
         """Get emoji for sentiment"""
         phase = analysis.get('narrative_phase', '').lower()
-        if 'peak' in phase or 'euphoria' in phase:
-            return "🚀 Euphoric"
-        elif 'discovery' in phase or 'validation' in phase:
-            return "📈 Building"
-        elif 'doubt' in phase or 'decline' in phase:
-            return "📉 Declining"
-        else:
-            return "➡️ Neutral"
+        return next(
+            (sentiment for key, sentiment in _PHASE_SENTIMENT.items() if key in phase),
+            "➡️ Neutral"
+        )
 
     def _generate_final_assessment(self, analysis: dict) -> str:
         """Generate final trading assessment"""
@@ -4,12 +4,43 @@ TOKEN LAUNCH LIVE segment generator
 Monitors pump.fun for recent token launches and analyzes top ones with SWARM.
 """
 
+import asyncio
 import logging
+from bisect import bisect_left
 from ..models import SegmentContext, SegmentOutput
 from .base import SegmentGenerator
 
 logger = logging.getLogger(__name__)
 
+# Speaker-note templates: the header once, then one row per launch. Rows
+# with a SWARM analysis use the analyzed template, so each row is a single
+# format_map call
+_LAUNCH_HEADER_TEMPLATE = "=== TOKEN LAUNCH LIVE ===\n\nDetected {count} fresh launches in the past 5 minutes:\n"
+_LAUNCH_ROW_TEMPLATE = "\n{rank}. ${ticker}\n   Address: {address}...\n   Launch Price: ${price:.8f}\n"
+_LAUNCH_ANALYZED_ROW_TEMPLATE = (
+    "\n{rank}. ${ticker}\n   Address: {address}...\n   Launch Price: ${price:.8f}"
+    "\n   Regime: {regime}\n   Narrative: {narrative_phase}\n   Risk: {risk:.2f} ({risk_level})\n"
+)
+
+# Notes used when pump.fun returns no launches (or isn't configured)
+_FALLBACK_NOTES = """
+TOKEN LAUNCH LIVE
+
+No new launches detected in the past 5 minutes.
+The pump.fun pipeline is quiet right now.
+
+We'll check back next segment for fresh deployments.
+""".strip()
+
+# Risk bands: above 0.7 is HIGH, above 0.4 MEDIUM, otherwise LOW
+_RISK_THRESHOLDS = (0.4, 0.7)
+_RISK_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
+
+def _risk_level(risk: float) -> str:
+    """Band a SWARM risk score (bisect over the thresholds, like searchsorted)"""
+    return _RISK_LEVELS[bisect_left(_RISK_THRESHOLDS, risk)]
+
 
 class TokenLaunchGenerator(SegmentGenerator):
     """Generate content for TOKEN LAUNCH LIVE segment"""
@@ -38,34 +69,42 @@ class TokenLaunchGenerator(SegmentGenerator):
                     swarm_analyses=[]
                 )
 
-            # Analyze each launch with SWARM
-            analyses = []
-            featured_tokens = []
-
-            for launch in launches:
-                token_data = {
+            featured_tokens = [
+                {
                     "token_address": launch.get("token_address"),
                     "ticker": launch.get("ticker", "UNKNOWN"),
                     "discovered_at": launch.get("discovered_at"),
                     "price": launch.get("price_at_discovery")
                 }
-                featured_tokens.append(token_data)
+                for launch in launches
+            ]
 
-                # Get SWARM analysis if available
-                if self.swarm:
-                    try:
-                        analysis = await self.swarm.analyze_token(
+            # Analyze every launch with SWARM concurrently; a failed call
+            # only drops that token's analysis
+            analyses = []
+            if self.swarm:
+                results = await asyncio.gather(
+                    *(
+                        self.swarm.analyze_token(
                             ticker=token_data["ticker"],
                             token_address=token_data["token_address"]
                         )
-                        analyses.append({
-                            "token": token_data["ticker"],
-                            "regime": analysis.get("regime", "Unknown"),
-                            "narrative_phase": analysis.get("narrative_phase", "Unknown"),
-                            "risk_score": analysis.get("risk_score", 0.5)
-                        })
-                    except Exception as e:
-                        logger.error(f"SWARM analysis failed for {token_data['ticker']}: {e}")
+                        for token_data in featured_tokens
+                    ),
+                    return_exceptions=True
+                )
+
+                for token_data, analysis in zip(featured_tokens, results):
+                    if isinstance(analysis, Exception):
+                        logger.error("SWARM analysis failed for %s: %s", token_data["ticker"], analysis)
+                        continue
+
+                    analyses.append({
+                        "token": token_data["ticker"],
+                        "regime": analysis.get("regime", "Unknown"),
+                        "narrative_phase": analysis.get("narrative_phase", "Unknown"),
+                        "risk_score": analysis.get("risk_score", 0.5)
+                    })
 
             # Format speaker notes
             speaker_notes = self._format_token_launch_notes(launches, analyses)
@@ -78,7 +117,8 @@ class TokenLaunchGenerator(SegmentGenerator):
             )
 
         except Exception as e:
-            logger.error(f"Error generating TOKEN_LAUNCH segment: {e}", exc_info=True)
+            # Full tracebacks only when debugging; SWARM outages can make this path hot
+            logger.error("Error generating TOKEN_LAUNCH segment: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return SegmentOutput(
                 speaker_notes=f"Error generating content: {str(e)}",
                 featured_tokens=[],
@@ -87,41 +127,32 @@ class TokenLaunchGenerator(SegmentGenerator):
 
     def _generate_fallback_notes(self) -> str:
         """Fallback notes when no launches available"""
-        return """
-TOKEN LAUNCH LIVE
-
-No new launches detected in the past 5 minutes.
-The pump.fun pipeline is quiet right now.
-
-We'll check back next segment for fresh deployments.
-        """.strip()
+        return _FALLBACK_NOTES
 
     def _format_token_launch_notes(self, launches: list, analyses: list) -> str:
         """Format speaker notes for token launches"""
-        lines = [
-            "=== TOKEN LAUNCH LIVE ===",
-            "",
-            f"Detected {len(launches)} fresh launches in the past 5 minutes:",
-            ""
-        ]
-
-        for i, launch in enumerate(launches):
-            ticker = launch.get("ticker", "UNKNOWN")
-            price = launch.get("price_at_discovery", 0)
-            address = launch.get("token_address", "")[:10]
-
-            lines.append(f"{i+1}. ${ticker}")
-            lines.append(f"   Address: {address}...")
-            lines.append(f"   Launch Price: ${price:.8f}")
+        header = _LAUNCH_HEADER_TEMPLATE.format_map({"count": len(launches)})
+
+        rows = []
+        for rank, launch in enumerate(launches, 1):
+            row = {
+                "rank": rank,
+                "ticker": launch.get("ticker", "UNKNOWN"),
+                "address": (launch.get("token_address") or "")[:10],
+                "price": launch.get("price_at_discovery", 0)
+            }
+            template = _LAUNCH_ROW_TEMPLATE
 
             # Add SWARM analysis if available
-            if i < len(analyses):
-                analysis = analyses[i]
-                lines.append(f"   Regime: {analysis.get('regime')}")
-                lines.append(f"   Narrative: {analysis.get('narrative_phase')}")
-                risk = analysis.get('risk_score', 0.5)
-                lines.append(f"   Risk: {risk:.2f} ({'HIGH' if risk > 0.7 else 'MEDIUM' if risk > 0.4 else 'LOW'})")
-
-            lines.append("")
-
-        return "\n".join(lines)
+            if rank <= len(analyses):
+                analysis = analyses[rank - 1]
+                risk = analysis.get("risk_score", 0.5)
+                row["regime"] = analysis.get("regime")
+                row["narrative_phase"] = analysis.get("narrative_phase")
+                row["risk"] = risk
+                row["risk_level"] = _risk_level(risk)
+                template = _LAUNCH_ANALYZED_ROW_TEMPLATE
+
+            rows.append(template.format_map(row))
+
+        return header + "".join(rows)
@@ -0,0 +1,184 @@
+"""
+Token Metrics Refresher
+
+Write-back queue that keeps PumpFunToken market columns fresh off the
+request path.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from .database.models import PumpFunToken
+
+logger = logging.getLogger(__name__)
+
+
+class TokenMetricsRefresher:
+    """
+    Batch token metric refreshes behind an asyncio queue
+
+    Reads return whatever is stored and call request(); a single background
+    task drains the queue, fetches metrics for each distinct token once and
+    writes the whole batch back with one executemany UPDATE. Tokens
+    refreshed within `ttl_seconds` are not requeued.
+
+    Each refresh also stores volume_velocity, the change in volume_24h per
+    hour since the previous refresh, so trending reads can sort on a
+    precomputed column.
+    """
+
+    def __init__(
+        self,
+        client,
+        session_factory: async_sessionmaker,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        ttl_seconds: float = 10.0
+    ):
+        """
+        Initialize refresher
+
+        Args:
+            client: PumpFunFetcher used to fetch live metrics
+            session_factory: Async database session factory
+            batch_size: Max tokens written per batch
+            flush_interval: Max seconds to wait while filling a batch
+            ttl_seconds: Minimum seconds between refreshes of one token
+        """
+        self.client = client
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.ttl_seconds = ttl_seconds
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._last_requested: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def request(self, token_address: str):
+        """Queue a refresh unless the token was refreshed within the TTL"""
+        now = time.monotonic()
+        last = self._last_requested.get(token_address)
+        if last is not None and now - last < self.ttl_seconds:
+            return
+        self._last_requested[token_address] = now
+        self._queue.put_nowait(token_address)
+
+    def start(self):
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background flush task"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        """Collect up to batch_size addresses or flush_interval seconds, then flush"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = {await self._queue.get()}
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.add(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(list(batch))
+            except Exception as e:
+                logger.error(f"Token metrics refresh failed: {e}", exc_info=True)
+
+            self._prune()
+
+    async def _flush(self, token_addresses: list):
+        """Fetch metrics for a batch and write them in one executemany UPDATE"""
+        results = await asyncio.gather(
+            *(self.client.get_token_metrics(a) for a in token_addresses),
+            return_exceptions=True
+        )
+
+        fetched = {
+            address: metrics
+            for address, metrics in zip(token_addresses, results)
+            if isinstance(metrics, dict)
+        }
+        if not fetched:
+            return
+
+        table = PumpFunToken.__table__
+        stmt = (
+            update(table)
+            .where(table.c.token_address == bindparam("b_token_address"))
+            .values(
+                current_price=bindparam("b_current_price"),
+                market_cap=bindparam("b_market_cap"),
+                holders_count=bindparam("b_holders_count"),
+                volume_24h=bindparam("b_volume_24h"),
+                volume_velocity=bindparam("b_volume_velocity"),
+                last_tracked_at=bindparam("b_last_tracked_at")
+            )
+        )
+
+        async with self.session_factory.begin() as db:
+            # Previous sample for every token in the batch, in one query
+            previous = {
+                row.token_address: row
+                for row in await db.execute(
+                    select(table.c.token_address, table.c.volume_24h, table.c.last_tracked_at)
+                    .where(table.c.token_address.in_(list(fetched)))
+                )
+            }
+
+            tracked_at = datetime.utcnow()
+            rows = []
+            for address, metrics in fetched.items():
+                volume = metrics.get("volume_24h")
+                rows.append({
+                    "b_token_address": address,
+                    "b_current_price": metrics.get("price"),
+                    "b_market_cap": metrics.get("market_cap"),
+                    "b_holders_count": metrics.get("holders"),
+                    "b_volume_24h": volume,
+                    "b_volume_velocity": self._velocity(previous.get(address), volume, tracked_at),
+                    "b_last_tracked_at": tracked_at
+                })
+
+            await db.execute(stmt, rows)
+
+        logger.debug(f"Refreshed metrics for {len(fetched)} tokens")
+
+    @staticmethod
+    def _velocity(previous, volume: Optional[float], tracked_at: datetime) -> Optional[float]:
+        """volume_24h change per hour since the previous sample, if there is one"""
+        if previous is None or previous.last_tracked_at is None:
+            return None
+        if previous.volume_24h is None or volume is None:
+            return None
+        hours = (tracked_at - previous.last_tracked_at).total_seconds() / 3600
+        if hours <= 0:
+            return None
+        return (volume - previous.volume_24h) / hours
+
+    def _prune(self):
+        """Forget TTL entries that have expired"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [a for a, t in self._last_requested.items() if t < cutoff]
+        for address in expired:
+            del self._last_requested[address]
@@ -11,18 +11,23 @@ Integrates:
 """
 
 import os
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
+import orjson
 
-from tokencast.database import init_db, get_db
+from tokencast.database import AsyncSessionLocal, PumpFunToken, engine, init_db, get_db
 from tokencast.orchestrator import TokencastOrchestrator
 from tokencast.routes import tokencast_router, pump_fun_router
 from tokencast.routes.tokencast import set_orchestrator
-from tokencast.routes.pump_fun import set_pump_fun_client
+from tokencast.routes.pump_fun import set_pump_fun_client, set_token_refresher
+from tokencast.token_refresher import TokenMetricsRefresher
 from tokencast.segment_generators import (
     TokenLaunchGenerator,
     SwarmAnalysisGenerator,
@@ -44,9 +49,20 @@ logger = logging.getLogger(__name__)
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 SWARM_API_URL = os.getenv("SWARM_API_URL", "http://localhost:8001")
 SWARM_API_KEY = os.getenv("SWARM_API_KEY", "")
+# Coalesce concurrent SWARM queries into one request (needs the SWARM batch endpoint)
+SWARM_BATCH_QUERIES = os.getenv("SWARM_BATCH_QUERIES", "false").lower() == "true"
 PUMPFUN_API_BASE = os.getenv("PUMPFUN_API_BASE", "https://api.pump.fun")
 TOKENCAST_PORT = int(os.getenv("PORT", os.getenv("TOKENCAST_PORT", "8002")))
 
+# Generator class per segment type, instantiated at startup
+SEGMENT_GENERATORS = (
+    (SegmentType.TOKEN_LAUNCH_LIVE, TokenLaunchGenerator),
+    (SegmentType.SWARM_ANALYSIS, SwarmAnalysisGenerator),
+    (SegmentType.MEME_ECONOMY, MemeEconomyGenerator),
+    (SegmentType.COMMUNITY_INTERACTION, CommunityInteractionGenerator),
+    (SegmentType.GAMBA, GambaSegmentGenerator),
+)
+
 # Global instances
 orchestrator = None
 pump_fun_client = None
@@ -54,47 +70,116 @@ swarm_client = None
 
 
 class SwarmClient:
-    """Simple SWARM API client wrapper"""
+    """
+    Simple SWARM API client wrapper
 
-    def __init__(self, api_url: str, api_key: str):
+    Non-empty results are cached per arguments for a short TTL, and
+    identical calls already in flight share a single request.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        ttl_seconds: float = 60.0,
+        query_ttl_seconds: float = 15.0
+    ):
         self.api_url = api_url
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.ttl_seconds = ttl_seconds
+        self.query_ttl_seconds = query_ttl_seconds
+        self._analyze_url = f"{api_url}/api/analyze-token"
+        self._query_url = f"{api_url}/api/swarm/query"
+        # Bodies are encoded with orjson, so the content type is set here once
+        self._headers = {"content-type": "application/json"}
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        # One pooled HTTP/2 client: concurrent calls multiplex over a shared
+        # connection, and failed connects are retried before surfacing
+        self.client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+                retries=2
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+
+        # call key -> (expiry on the monotonic clock, result)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
 
     async def analyze_token(self, ticker: str, token_address: str = None):
         """Analyze a token with full SWARM (PERCEPTRON + FOOLIO + AZOKA)"""
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+        return await self._cached(
+            ("analyze_token", ticker, token_address or ""),
+            self.ttl_seconds,
+            lambda: self._analyze_token(ticker, token_address)
+        )
 
+    async def query(self, question: str, ticker: str = None, token_address: str = None):
+        """Ask GIZMO a question"""
+        return await self._cached(
+            ("query", question, ticker, token_address),
+            self.query_ttl_seconds,
+            lambda: self._query(question=question, ticker=ticker, token_address=token_address)
+        )
+
+    async def _cached(self, key: Tuple, ttl: float, fetch: Callable[[], Awaitable[Any]]):
+        """Serve key from the TTL cache, or join/start the request for it"""
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(fetch())
+            self._inflight[key] = request
+            request.add_done_callback(lambda done: self._store(key, ttl, done))
+
+        # One caller being cancelled must not cancel the shared request
+        return await asyncio.shield(request)
+
+    def _store(self, key: Tuple, ttl: float, request: asyncio.Future):
+        """Internal: cache a finished request (errors come back as {})"""
+        self._inflight.pop(key, None)
+        if request.cancelled() or request.exception() is not None:
+            return
+
+        result = request.result()
+        if result:
+            now = time.monotonic()
+            if len(self._cache) >= 1024:
+                # Drop expired entries before growing further
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            self._cache[key] = (now + ttl, result)
+
+    async def _analyze_token(self, ticker: str, token_address: str = None):
+        """Internal: uncached analyze-token request"""
         try:
             response = await self.client.post(
-                f"{self.api_url}/api/analyze-token",
-                json={"ticker": ticker, "token_address": token_address or ""},
-                headers=headers
+                self._analyze_url,
+                content=orjson.dumps({"ticker": ticker, "token_address": token_address or ""}),
+                headers=self._headers
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"SWARM analyze_token error: {e}")
+            logger.error("SWARM analyze_token error: %s", e)
             return {}
 
-    async def query(self, question: str, ticker: str = None, token_address: str = None):
-        """Ask GIZMO a question"""
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-
+    async def _query(self, question: str, ticker: str = None, token_address: str = None):
+        """Internal: uncached query request"""
         try:
             response = await self.client.post(
-                f"{self.api_url}/api/swarm/query",
-                json={"question": question, "ticker": ticker, "token_address": token_address},
-                headers=headers
+                self._query_url,
+                content=orjson.dumps({"question": question, "ticker": ticker, "token_address": token_address}),
+                headers=self._headers
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            logger.error(f"SWARM query error: {e}")
+            logger.error("SWARM query error: %s", e)
             return {}
 
     async def close(self):
@@ -102,6 +187,137 @@ class SwarmClient:
         await self.client.aclose()
 
 
+class BatchedSwarmClient(SwarmClient):
+    """
+    SWARM client that coalesces concurrent query() cache misses
+
+    Queries issued within FLUSH_SECONDS of each other (up to MAX_BATCH) are
+    sent as one POST to /api/swarm/query/batch; every caller still awaits
+    its own result. A lone query goes to the regular endpoint.
+    """
+
+    MAX_BATCH = 16
+    FLUSH_SECONDS = 0.01
+
+    def __init__(self, api_url: str, api_key: str, **kwargs):
+        super().__init__(api_url, api_key, **kwargs)
+        self._batch_url = f"{api_url}/api/swarm/query/batch"
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def _query(self, question: str, ticker: str = None, token_address: str = None):
+        """Internal: queue a query to be sent with other in-flight questions"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((
+            {"question": question, "ticker": ticker, "token_address": token_address},
+            future
+        ))
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+        return await future
+
+    async def _run(self):
+        """Collect up to MAX_BATCH queries or FLUSH_SECONDS, then send them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + self.FLUSH_SECONDS
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # The flusher must outlive any single bad batch, or every later
+            # query() would wait on a queue nobody drains
+            try:
+                await self._send(batch)
+            except Exception as e:
+                logger.error("SWARM batch flush error: %s", e)
+
+    async def _send(self, batch: list):
+        """
+        POST one batch and resolve each caller's future with its result
+
+        Every future is resolved, with {} when the request fails or the
+        response isn't a list with a dict per query.
+        """
+        results = []
+        try:
+            if len(batch) == 1:
+                payload, _ = batch[0]
+                results = [await super()._query(**payload)]
+            else:
+                response = await self.client.post(
+                    self._batch_url,
+                    content=orjson.dumps([payload for payload, _ in batch]),
+                    headers=self._headers
+                )
+                response.raise_for_status()
+                results = orjson.loads(response.content)
+                if not isinstance(results, list):
+                    logger.error("SWARM batch query returned %s, expected a list", type(results).__name__)
+                    results = []
+        except Exception as e:
+            logger.error("SWARM batch query error: %s", e)
+        finally:
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    result = results[i] if i < len(results) else {}
+                    future.set_result(result if isinstance(result, dict) else {})
+
+    async def close(self):
+        """Stop the batch flusher and close HTTP client"""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        await super().close()
+
+
+class CachedPumpFun:
+    """
+    Short-TTL cache in front of the pump.fun client for segment generators
+
+    Generators that run within TTL_SECONDS of each other share one
+    detect_launches fetch per lookback window. Everything else is delegated
+    to the wrapped client unchanged.
+    """
+
+    TTL_SECONDS = 30.0
+
+    def __init__(self, inner: Any):
+        self._inner = inner
+        # lookback_minutes -> (monotonic expiry, launches)
+        self._launches: Dict[int, Tuple[float, Any]] = {}
+
+    async def detect_launches(self, lookback_minutes: int = 5):
+        now = time.monotonic()
+        cached = self._launches.get(lookback_minutes)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        launches = await self._inner.detect_launches(lookback_minutes=lookback_minutes)
+        self._launches[lookback_minutes] = (now + self.TTL_SECONDS, launches)
+        return launches
+
+    def __getattr__(self, name: str):
+        return getattr(self._inner, name)
+
+
+async def persist_launches(launches):
+    """Upsert each poll's new pump.fun launches in one transaction"""
+    async with AsyncSessionLocal.begin() as db:
+        await PumpFunToken.record_launches(db, launches)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -122,53 +338,66 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting Hyper-Threat Tokencast Server...")
 
-    # Initialize database
+    # Initialize database in the background; nothing below touches it until
+    # the generators are warm
     logger.info("Initializing database...")
-    init_db()
-
-    # Create pump.fun client
-    logger.info(f"Connecting to pump.fun API: {PUMPFUN_API_BASE}")
-    pump_fun_client = PumpFunFetcher(api_base=PUMPFUN_API_BASE)
-    set_pump_fun_client(pump_fun_client)
-
-    # Create SWARM client
-    logger.info(f"Connecting to SWARM API: {SWARM_API_URL}")
-    swarm_client = SwarmClient(api_url=SWARM_API_URL, api_key=SWARM_API_KEY)
-
-    # Create orchestrator
-    logger.info("Initializing Tokencast Orchestrator...")
-    # Create a database session for the orchestrator (stays open during app lifetime)
-    from tokencast.database.db import SessionLocal
-    db = SessionLocal()
-    orchestrator = TokencastOrchestrator(
-        db_session=db,
-        swarm_client=swarm_client,
-        pump_fun_client=pump_fun_client,
-        telegram_bot=None  # TODO: Add telegram bot if needed
-    )
-
-    # Register segment generators
-    logger.info("Registering segment generators...")
-    orchestrator.register_segment_generator(
-        SegmentType.TOKEN_LAUNCH_LIVE,
-        TokenLaunchGenerator(swarm_client, None, pump_fun_client)
-    )
-    orchestrator.register_segment_generator(
-        SegmentType.SWARM_ANALYSIS,
-        SwarmAnalysisGenerator(swarm_client, None, pump_fun_client)
-    )
-    orchestrator.register_segment_generator(
-        SegmentType.MEME_ECONOMY,
-        MemeEconomyGenerator(swarm_client, None, pump_fun_client)
-    )
-    orchestrator.register_segment_generator(
-        SegmentType.COMMUNITY_INTERACTION,
-        CommunityInteractionGenerator(swarm_client, None, pump_fun_client)
-    )
-    orchestrator.register_segment_generator(
-        SegmentType.GAMBA,
-        GambaSegmentGenerator(swarm_client, None, pump_fun_client)
-    )
+    db_ready = asyncio.create_task(init_db())
+
+    try:
+        # Create pump.fun client
+        logger.info(f"Connecting to pump.fun API: {PUMPFUN_API_BASE}")
+        pump_fun_client = PumpFunFetcher(api_base=PUMPFUN_API_BASE, on_launches=persist_launches)
+        set_pump_fun_client(pump_fun_client)
+
+        # Create SWARM client
+        logger.info(f"Connecting to SWARM API: {SWARM_API_URL}")
+        swarm_client_cls = BatchedSwarmClient if SWARM_BATCH_QUERIES else SwarmClient
+        swarm_client = swarm_client_cls(api_url=SWARM_API_URL, api_key=SWARM_API_KEY)
+
+        # Create orchestrator
+        logger.info("Initializing Tokencast Orchestrator...")
+        # The orchestrator opens a short-lived session per operation
+        orchestrator = TokencastOrchestrator(
+            session_factory=AsyncSessionLocal,
+            swarm_client=swarm_client,
+            pump_fun_client=pump_fun_client,
+            telegram_bot=None  # TODO: Add telegram bot if needed
+        )
+
+        # Register segment generators; they share a cached view of pump.fun
+        # while routes and the refresher keep the raw client
+        logger.info("Registering segment generators...")
+        generator_pump_fun = CachedPumpFun(pump_fun_client)
+        generators = [
+            (segment_type, generator_cls(swarm_client, None, generator_pump_fun))
+            for segment_type, generator_cls in SEGMENT_GENERATORS
+        ]
+        for segment_type, generator in generators:
+            orchestrator.register_segment_generator(segment_type, generator)
+
+        # Warm every generator concurrently; a failed warmup is not fatal
+        results = await asyncio.gather(
+            *(generator.warmup() for _, generator in generators),
+            return_exceptions=True
+        )
+        for (segment_type, _), result in zip(generators, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Warmup failed for {segment_type.value}: {result}")
+    except BaseException:
+        # Don't leave init_db running (or its failure unretrieved) when
+        # startup aborts
+        db_ready.cancel()
+        await asyncio.gather(db_ready, return_exceptions=True)
+        await engine.dispose()
+        raise
+
+    # Tables must exist before the refresher writes or routes are served
+    await db_ready
+
+    # Background write-back of token metrics for /status reads
+    token_refresher = TokenMetricsRefresher(pump_fun_client, AsyncSessionLocal)
+    token_refresher.start()
+    set_token_refresher(token_refresher)
 
     # Set global orchestrator for routes
     set_orchestrator(orchestrator)
@@ -181,15 +410,16 @@ async def lifespan(app: FastAPI):
     logger.info("👋 Shutting down Tokencast Server...")
 
     # Close connections
+    await token_refresher.stop()
+
     if pump_fun_client:
         await pump_fun_client.close()
 
     if swarm_client:
         await swarm_client.close()
 
-    # Close database session
-    if orchestrator and orchestrator.db:
-        orchestrator.db.close()
+    # Close database connections
+    await engine.dispose()
 
     logger.info("Shutdown complete")
 
@@ -199,20 +429,26 @@ app = FastAPI(
     title="Hyper-Threat Tokencast",
     description="9-segment rotating cryptocurrency live show orchestration system",
     version="1.0.0",
+    # Routes with a response model or return type are serialized straight to
+    # JSON bytes by Pydantic (FastAPI >= 0.130), replacing ORJSONResponse
     lifespan=lifespan
 )
 
-# CORS
+# CORS: explicit methods/headers (the API only serves GET/POST JSON) and a
+# one-day preflight cache so browsers skip repeated OPTIONS round-trips
+CORS_ALLOW_ORIGINS = ["*"] if ENVIRONMENT == "development" else [
+    "https://hyper-threat.tv",
+    "http://localhost:3000",
+    "https://attn.money"
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if ENVIRONMENT == "development" else [
-        "https://hyper-threat.tv",
-        "http://localhost:3000",
-        "https://attn.money"
-    ],
+    allow_origins=CORS_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
 # Include routers
@@ -268,5 +504,9 @@ if __name__ == "__main__":
         "tokencast_server:app",
         host="0.0.0.0",
         port=TOKENCAST_PORT,
-        reload=ENVIRONMENT == "development"
+        reload=ENVIRONMENT == "development",
+        # libuv event loop + C HTTP parser (both ship with uvicorn[standard]).
+        # Stay on a single worker: the orchestrator holds the live show in memory.
+        loop="uvloop",
+        http="httptools"
     )